@@ -2,16 +2,19 @@
 ShinhanESG Enterprise - 최종 통합 애플리케이션 v4.0
 대기업 ESG 통합관리 플랫폼
 """
+from __future__ import annotations
+
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import sys
 import os
 import numpy as np
-import time
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # src 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -19,10 +22,9 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 # 로컬 모듈 import
 from src.enterprise_esg_engine import EnterpriseESGEngine
 from src.data_loader import DataLoader
-from src.ai_prediction_finance import AIPredictor
-from src.financial_products import FinancialProductMatcher
-from src.supply_chain_analysis import SupplyChainAnalyzer
-from src.presentation_report import PresentationMode, ReportGenerator
+from src.chart_utils import lttb_indices
+from src.presentation_report import PresentationMode, ReportGenerator, COMPLIANCE_STANDARDS
+from src.ui_helpers import bullet_markdown
 
 # 페이지 설정
 st.set_page_config(
@@ -208,6 +210,14 @@ st.markdown("""
         box-shadow: 0 4px 12px rgba(0, 70, 255, 0.3);
     }
     
+    /* 화면 선택 (가로 라디오) */
+    div[role="radiogroup"] {
+        gap: 8px;
+        background: #f8f9fa;
+        padding: 8px;
+        border-radius: 16px;
+    }
+    
     /* 정보 카드 */
     .info-card {
         background: linear-gradient(135deg, #0046FF, #0072CE);
@@ -409,21 +419,119 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# 전역 객체 초기화
+# 전역 객체 초기화 (서브시스템별 지연 생성, 프로세스당 1회)
 @st.cache_resource
-def init_systems():
-    """시스템 초기화"""
-    return (
-        EnterpriseESGEngine(),
-        DataLoader(),
-        AIPredictor(),
-        FinancialProductMatcher(),
-        SupplyChainAnalyzer(),
-        PresentationMode(),
-        ReportGenerator()
-    )
+def get_engine():
+    """ESG 평가 엔진"""
+    return EnterpriseESGEngine()
+
+@st.cache_resource
+def get_data_loader():
+    """기업 데이터 로더"""
+    return DataLoader()
+
+@st.cache_resource
+def get_presentation_mode():
+    """프레젠테이션 모드"""
+    return PresentationMode()
+
+@st.cache_resource
+def get_report_generator():
+    """리포트 생성기"""
+    return ReportGenerator()
+
+# 사이드바·등급 표시에 항상 필요한 서브시스템
+engine = get_engine()
+data_loader = get_data_loader()
+
+# 분석 엔진 (첫 사용 시 모듈 로드 및 생성)
+@st.cache_resource
+def get_ai_predictor():
+    """AI 예측 엔진"""
+    from src.ai_prediction_finance import AIPredictor
+    return AIPredictor()
+
+@st.cache_resource
+def get_product_matcher():
+    """금융상품 매칭 엔진"""
+    from src.financial_products import FinancialProductMatcher
+    return FinancialProductMatcher()
+
+@st.cache_resource
+def get_supply_chain_analyzer():
+    """공급망 분석 엔진"""
+    from src.supply_chain_analysis import SupplyChainAnalyzer
+    return SupplyChainAnalyzer()
+
+# 등급 체계 파생 테이블 (스크립트 재실행과 무관하게 프로세스당 1회 생성)
+@st.cache_resource
+def grade_tables():
+    """등급 목록/색상/인덱스 테이블"""
+    grades = tuple(engine.grade_system.keys())
+    colors = tuple(info['color'] for info in engine.grade_system.values())
+    return grades, colors, {grade: i for i, grade in enumerate(grades)}
+
+GRADES, GRADE_COLORS, GRADE_IDX = grade_tables()
+
+# ESG 영역 (탭 이름, 키)
+ESG_AREAS = (("환경", 'E'), ("사회", 'S'), ("거버넌스", 'G'))
 
-engine, data_loader, ai_predictor, product_matcher, supply_chain_analyzer, presentation_mode, report_generator = init_systems()
+# 예측 기간 (라벨 -> 개월 수)
+PERIOD_MAP = {"3개월": 3, "6개월": 6, "1년": 12, "3년": 36}
+
+# 개선 시나리오 프리셋 (시나리오 × 영역 E/S/G 개선폭, 투자금액)
+SCENARIO_NAMES = ('보수적', '중도적', '공격적')
+SCENARIO_IMPACTS = np.array([
+    [5, 3, 2],
+    [10, 8, 7],
+    [20, 15, 15]
+], dtype=float)
+SCENARIO_INVESTMENTS = np.array([200, 500, 1000], dtype=float)
+
+# 부분 재실행 데코레이터 (미지원 버전에서는 일반 함수로 동작)
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+def grade_color(grade: str) -> str:
+    """등급 색상 조회"""
+    return GRADE_COLORS[GRADE_IDX[grade]]
+
+# 사이드바 재실행 시 반복 조회 캐시
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_enterprise_list() -> List[str]:
+    """기업 목록 조회 (캐시)"""
+    return data_loader.get_enterprise_list()
+
+@st.cache_data(show_spinner=False)
+def load_enterprise_data(enterprise_name: str) -> Optional[Dict]:
+    """기업 데이터 조회 (캐시)"""
+    data = data_loader.get_enterprise_data(enterprise_name)
+    if not data:
+        return data
+    
+    # 사이드바 표시용 문자열 (조회 시 1회 포맷)
+    basic_info = data.get('basic_info', {})
+    return {
+        **data,
+        'basic_info_formatted': {
+            'industry': basic_info.get('industry', 'N/A'),
+            'employee_count': f"{basic_info.get('employee_count', 0):,}명",
+            'asset_size': f"{basic_info.get('asset_size', 0):,}억",
+            'revenue': f"{basic_info.get('revenue', 10000):,}억"
+        }
+    }
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def evaluate_enterprise_cached(enterprise_name: str) -> Dict:
+    """ESG 평가 (기업명 기준 캐시)"""
+    evaluation = engine.evaluate_enterprise(load_enterprise_data(enterprise_name))
+    # 렌더링용 영역별 세부 점수 사전 추출
+    evaluation['flat_scores'] = {
+        area: [(key.replace('_', ' ').title(), value['score'])
+               for key, value in evaluation['details'][area].items()
+               if isinstance(value, dict) and 'score' in value]
+        for area in ('E', 'S', 'G')
+    }
+    return evaluation
 
 def main():
     # 프레젠테이션 모드 체크
@@ -456,28 +564,19 @@ def display_normal_mode():
     # 푸터
     display_modern_footer()
 
+# 헤더 (평가 여부와 무관하게 동일)
+HEADER_HTML = """
+<div class="hero-header fade-in">
+    <div style="position: relative; z-index: 1;">
+        <h1 class="hero-title">ShinhanESG Enterprise</h1>
+        <p class="hero-subtitle">AI 기반 대기업 ESG 통합관리 플랫폼 | Powered by Minseong Park</p>
+    </div>
+</div>
+"""
+
 def display_modern_header():
     """모던 헤더 디자인"""
-    if 'evaluation_result' in st.session_state:
-        header_html = """
-        <div class="hero-header fade-in">
-            <div style="position: relative; z-index: 1;">
-                <h1 class="hero-title">ShinhanESG Enterprise</h1>
-                <p class="hero-subtitle">AI 기반 대기업 ESG 통합관리 플랫폼 | Powered by Minseong Park</p>
-            </div>
-        </div>
-        """
-    else:
-        header_html = """
-        <div class="hero-header fade-in">
-            <div style="position: relative; z-index: 1;">
-                <h1 class="hero-title">ShinhanESG Enterprise</h1>
-                <p class="hero-subtitle">AI 기반 대기업 ESG 통합관리 플랫폼 | Powered by Minseong Park</p>
-            </div>
-        </div>
-        """
-    
-    st.markdown(header_html, unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     # 버튼 액션 처리 (평가 완료시 - 헤더 아래에 버튼 배치)
     if 'evaluation_result' in st.session_state:
@@ -498,6 +597,8 @@ def display_modern_header():
             if st.button("대시보드", key="header_dash_btn", use_container_width=True):
                 # 리포트 모달 닫기
                 st.session_state.show_report_modal = False
+                # 종합 대시보드 화면으로 전환
+                st.session_state.active_tab = "종합 대시보드"
                 # 대시보드로 스크롤 (자바스크립트 사용)
                 st.markdown("""
                 <script>
@@ -513,117 +614,66 @@ def display_modern_header():
         if st.session_state.get('show_report_modal', False):
             display_report_modal()
 
+# 메트릭 카드
+METRIC_CARD_HTML = (
+    '<div class="metric-card"><div class="metric-label">{label}</div>'
+    '<div class="metric-value">{value}</div><div class="metric-delta">{delta}</div></div>'
+)
+
+# 등급 배지 카드
+GRADE_BADGE_HTML = (
+    '<div class="metric-card"><div class="metric-label">ESG 등급</div>'
+    '<div class="grade-badge" style="background: {color}; color: white;">{grade}</div></div>'
+)
+
 def display_modern_metrics():
     """모던 메트릭 카드"""
     evaluation = st.session_state.evaluation_result
+    benefits = evaluation['financial_benefits']
     
-    # 컬럼으로 메트릭 표시
-    cols = st.columns(6)
-    
-    # ESG 등급
-    with cols[0]:
-        grade = evaluation['grade']
-        grade_color = engine.grade_system[grade]['color']
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-label">ESG 등급</div>
-            <div class="grade-badge" style="background: {grade_color}; color: white;">
-                {grade}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # ESG 총점
-    with cols[1]:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-label">ESG 총점</div>
-            <div class="metric-value">{evaluation['scores']['total']:.1f}</div>
-            <div class="metric-delta">▲ {evaluation['scores']['total']-70:.1f}</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # 금리 우대
-    with cols[2]:
-        benefits = evaluation['financial_benefits']
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-label">금리 우대</div>
-            <div class="metric-value">{benefits['discount_rate']}%p</div>
-            <div class="metric-delta">연 {benefits['annual_savings']:.0f}억 절감</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # AI 신뢰도
-    with cols[3]:
-        if 'ai_predictions' in st.session_state:
-            confidence = st.session_state.ai_predictions['confidence']['confidence_score']
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-label">AI 신뢰도</div>
-                <div class="metric-value">{confidence:.0f}%</div>
-                <div class="metric-delta">예측 활성화</div>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown("""
-            <div class="metric-card">
-                <div class="metric-label">AI 신뢰도</div>
-                <div class="metric-value">-</div>
-                <div class="metric-delta">대기</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    # 금융상품
-    with cols[4]:
-        if 'matched_products' in st.session_state:
-            product_count = len(st.session_state.matched_products['recommended_loans'])
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-label">추천 상품</div>
-                <div class="metric-value">{product_count}개</div>
-                <div class="metric-delta">매칭 완료</div>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown("""
-            <div class="metric-card">
-                <div class="metric-label">추천 상품</div>
-                <div class="metric-value">-</div>
-                <div class="metric-delta">대기</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    # 공급망
-    with cols[5]:
-        if 'supply_chain_analysis' in st.session_state:
-            supply_grade = st.session_state.supply_chain_analysis['risk_assessment']['supply_chain_grade']
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-label">공급망 등급</div>
-                <div class="metric-value">{supply_grade}</div>
-                <div class="metric-delta">분석 완료</div>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown("""
-            <div class="metric-card">
-                <div class="metric-label">공급망 등급</div>
-                <div class="metric-value">-</div>
-                <div class="metric-delta">대기</div>
-            </div>
-            """, unsafe_allow_html=True)
+    # 분석 결과별 카드 (라벨, 값, 보조 문구)
+    cards = [
+        ("ESG 총점", f"{evaluation['scores']['total']:.1f}", f"▲ {evaluation['scores']['total']-70:.1f}"),
+        ("금리 우대", f"{benefits['discount_rate']}%p", f"연 {benefits['annual_savings']:.0f}억 절감")
+    ]
+    if 'ai_predictions' in st.session_state:
+        confidence = st.session_state.ai_predictions['confidence']['confidence_score']
+        cards.append(("AI 신뢰도", f"{confidence:.0f}%", "예측 활성화"))
+    else:
+        cards.append(("AI 신뢰도", "-", "대기"))
+    if 'matched_products' in st.session_state:
+        product_count = len(st.session_state.matched_products['recommended_loans'])
+        cards.append(("추천 상품", f"{product_count}개", "매칭 완료"))
+    else:
+        cards.append(("추천 상품", "-", "대기"))
+    if 'supply_chain_analysis' in st.session_state:
+        supply_grade = st.session_state.supply_chain_analysis['risk_assessment']['supply_chain_grade']
+        cards.append(("공급망 등급", supply_grade, "분석 완료"))
+    else:
+        cards.append(("공급망 등급", "-", "대기"))
+    
+    # 메트릭 그리드를 한 번의 마크다운으로 표시 (첫 카드는 등급 배지)
+    grade = evaluation['grade']
+    html = [GRADE_BADGE_HTML.format(color=grade_color(grade), grade=grade)]
+    html.extend(METRIC_CARD_HTML.format(label=label, value=value, delta=delta)
+                for label, value, delta in cards)
+    st.markdown(f'<div class="metric-grid">{"".join(html)}</div>', unsafe_allow_html=True)
+
+# 사이드바 로고 (브라우저가 URL을 직접 받아 HTTP 캐시로 재사용)
+LOGO_URL = "https://i.namu.wiki/i/Etmt-wojOBWr5gVcPR0qrTxuej558yfzzyYr0xXYSxljpLuEdPWGSPi-aPdJHQrpZY2o7zvuUMb4PE6PvFjQ3Q.svg"
+
+LOGO_HTML = f"""
+<div style="text-align: center; padding: 1rem 0;">
+    <img src="{LOGO_URL}" 
+         style="width: 100%; max-width: 200px;">
+</div>
+"""
 
 def setup_sidebar():
     """사이드바 설정"""
     with st.sidebar:
         # 로고
-        st.markdown("""
-        <div style="text-align: center; padding: 1rem 0;">
-            <img src="https://i.namu.wiki/i/Etmt-wojOBWr5gVcPR0qrTxuej558yfzzyYr0xXYSxljpLuEdPWGSPi-aPdJHQrpZY2o7zvuUMb4PE6PvFjQ3Q.svg" 
-                 style="width: 100%; max-width: 200px;">
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(LOGO_HTML, unsafe_allow_html=True)
         
         st.markdown("---")
         
@@ -631,7 +681,7 @@ def setup_sidebar():
         st.markdown("### 평가 설정")
         
         # 기업 선택
-        enterprise_list = data_loader.get_enterprise_list()
+        enterprise_list = load_enterprise_list()
         if enterprise_list:
             selected_enterprise = st.selectbox(
                 "평가 대상 기업",
@@ -640,7 +690,7 @@ def setup_sidebar():
             )
             
             # 기업 정보
-            enterprise_data = data_loader.get_enterprise_data(selected_enterprise)
+            enterprise_data = load_enterprise_data(selected_enterprise)
             if enterprise_data:
                 display_company_info(enterprise_data)
                 
@@ -661,7 +711,7 @@ def setup_sidebar():
                 if enable_ai:
                     prediction_period = st.select_slider(
                         "예측 기간",
-                        options=["3개월", "6개월", "1년", "3년"],
+                        options=list(PERIOD_MAP),
                         value="1년"
                     )
                 
@@ -685,7 +735,7 @@ def setup_sidebar():
 
 def display_company_info(enterprise_data):
     """기업 정보 표시"""
-    basic_info = enterprise_data.get('basic_info', {})
+    formatted = enterprise_data['basic_info_formatted']
     
     st.markdown(f"""
     <div class="info-card">
@@ -693,27 +743,89 @@ def display_company_info(enterprise_data):
         <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1.5rem; margin-top: 1.5rem;">
             <div style="background: rgba(255, 255, 255, 0.15); padding: 1.2rem; border-radius: 12px; border: 1px solid rgba(255, 255, 255, 0.2);">
                 <div style="color: rgba(255, 255, 255, 0.9); font-size: 0.9rem; font-weight: 500; margin-bottom: 0.5rem;">업종</div>
-                <div style="color: white; font-size: 1.4rem; font-weight: 600;">{basic_info.get('industry', 'N/A')}</div>
+                <div style="color: white; font-size: 1.4rem; font-weight: 600;">{formatted['industry']}</div>
             </div>
             <div style="background: rgba(255, 255, 255, 0.15); padding: 1.2rem; border-radius: 12px; border: 1px solid rgba(255, 255, 255, 0.2);">
                 <div style="color: rgba(255, 255, 255, 0.9); font-size: 0.9rem; font-weight: 500; margin-bottom: 0.5rem;">직원수</div>
-                <div style="color: white; font-size: 1.4rem; font-weight: 600;">{basic_info.get('employee_count', 0):,}명</div>
+                <div style="color: white; font-size: 1.4rem; font-weight: 600;">{formatted['employee_count']}</div>
             </div>
             <div style="background: rgba(255, 255, 255, 0.15); padding: 1.2rem; border-radius: 12px; border: 1px solid rgba(255, 255, 255, 0.2);">
                 <div style="color: rgba(255, 255, 255, 0.9); font-size: 0.9rem; font-weight: 500; margin-bottom: 0.5rem;">자산</div>
-                <div style="color: white; font-size: 1.4rem; font-weight: 600;">{basic_info.get('asset_size', 0):,}억</div>
+                <div style="color: white; font-size: 1.4rem; font-weight: 600;">{formatted['asset_size']}</div>
             </div>
             <div style="background: rgba(255, 255, 255, 0.15); padding: 1.2rem; border-radius: 12px; border: 1px solid rgba(255, 255, 255, 0.2);">
                 <div style="color: rgba(255, 255, 255, 0.9); font-size: 0.9rem; font-weight: 500; margin-bottom: 0.5rem;">매출</div>
-                <div style="color: white; font-size: 1.4rem; font-weight: 600;">{basic_info.get('revenue', 10000):,}억</div>
+                <div style="color: white; font-size: 1.4rem; font-weight: 600;">{formatted['revenue']}</div>
             </div>
         </div>
     </div>
     """, unsafe_allow_html=True)
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def today_stamp() -> str:
+    """파일명용 날짜 문자열 (시간 단위 캐시)"""
+    return datetime.now().strftime('%Y%m%d')
+
+# 리포트 미리보기 HTML 템플릿
+REPORT_PREVIEW_HTML = """
+    <div class="report-preview">
+        <h2 style="color: #0046FF; margin-bottom: 1rem;">ESG 종합 평가 리포트</h2>
+        <p><strong>기업명:</strong> {company_name}</p>
+        <p><strong>평가일:</strong> {date}</p>
+        <hr style="margin: 1.5rem 0;">
+        <h3 style="color: #333;">주요 결과</h3>
+        <ul>
+            <li>ESG 등급: <strong style="color: {grade_color};">{grade}</strong></li>
+            <li>종합 점수: <strong>{total:.1f}점</strong></li>
+            <li>금리 우대: <strong>{discount_rate}%p</strong></li>
+            <li>연간 절감: <strong>{annual_savings:.0f}억원</strong></li>
+        </ul>
+        <hr style="margin: 1.5rem 0;">
+        <h3 style="color: #333;">영역별 점수</h3>
+        <ul>
+            <li>환경(E): {E:.1f}점</li>
+            <li>사회(S): {S:.1f}점</li>
+            <li>거버넌스(G): {G:.1f}점</li>
+        </ul>
+    </div>
+    """
+
+@st.cache_data(show_spinner=False)
+def render_report_preview(company_name: str, evaluation_date: str) -> str:
+    """리포트 미리보기 HTML 생성 (기업명·평가일 기준 캐시)"""
+    evaluation = evaluate_enterprise_cached(company_name)
+    scores = evaluation['scores']
+    benefits = evaluation['financial_benefits']
+    
+    return REPORT_PREVIEW_HTML.format_map({
+        'company_name': company_name,
+        'date': evaluation_date,
+        'grade_color': grade_color(evaluation['grade']),
+        'grade': evaluation['grade'],
+        'total': scores['total'],
+        'discount_rate': benefits['discount_rate'],
+        'annual_savings': benefits['annual_savings'],
+        'E': scores['E'],
+        'S': scores['S'],
+        'G': scores['G']
+    })
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_report_download_link(company_name: str, evaluation: Dict, ai_predictions: Optional[Dict],
+                               matched_products: Optional[Dict], supply_chain: Optional[Dict], stamp: str) -> str:
+    """HTML 리포트 다운로드 링크 생성 (화면에 표시 중인 세션 결과 기준 캐시)"""
+    report_generator = get_report_generator()
+    html_report = report_generator.generate_html_report(
+        evaluation, company_name, ai_predictions, matched_products, supply_chain
+    )
+    return report_generator.create_pdf_download_link(
+        html_report, f"ESG_Report_{company_name}_{stamp}.pdf"
+    )
+
 def display_report_modal():
     """리포트 생성 모달"""
     evaluation = st.session_state.evaluation_result
+    report_generator = get_report_generator()
     company_name = st.session_state.get('selected_enterprise', 'Unknown')
     
     # 리포트 생성 옵션
@@ -723,21 +835,17 @@ def display_report_modal():
         with col1:
             if st.button("대시보드 PDF", use_container_width=True):
                 with st.spinner("PDF 생성 중..."):
-                    html_report = report_generator.generate_html_report(
-                        evaluation,
+                    download_link = build_report_download_link(
                         company_name,
+                        evaluation,
                         st.session_state.get('ai_predictions'),
                         st.session_state.get('matched_products'),
-                        st.session_state.get('supply_chain_analysis')
-                    )
-                    
-                    download_link = report_generator.create_pdf_download_link(
-                        html_report,
-                        f"ESG_Report_{company_name}_{datetime.now().strftime('%Y%m%d')}.pdf"
+                        st.session_state.get('supply_chain_analysis'),
+                        today_stamp()
                     )
                     
                     st.markdown(download_link, unsafe_allow_html=True)
-                    st.success("리포트가 생성되었습니다!")
+                    st.toast("리포트가 생성되었습니다!", icon="📄")
         
         with col2:
             if st.button("Excel 데이터", use_container_width=True):
@@ -750,36 +858,18 @@ def display_report_modal():
                     st.download_button(
                         label="Excel 다운로드",
                         data=excel_data,
-                        file_name=f"ESG_Data_{company_name}_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                        file_name=f"ESG_Data_{company_name}_{today_stamp()}.xlsx",
                         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
                     )
-                    st.success("Excel 파일이 생성되었습니다!")
+                    st.toast("Excel 파일이 생성되었습니다!", icon="📊")
     
     # 리포트 미리보기
     st.markdown("### 리포트 미리보기")
     
-    preview_html = f"""
-    <div class="report-preview">
-        <h2 style="color: #0046FF; margin-bottom: 1rem;">ESG 종합 평가 리포트</h2>
-        <p><strong>기업명:</strong> {company_name}</p>
-        <p><strong>평가일:</strong> {datetime.now().strftime('%Y년 %m월 %d일')}</p>
-        <hr style="margin: 1.5rem 0;">
-        <h3 style="color: #333;">주요 결과</h3>
-        <ul>
-            <li>ESG 등급: <strong style="color: {engine.grade_system[evaluation['grade']]['color']};">{evaluation['grade']}</strong></li>
-            <li>종합 점수: <strong>{evaluation['scores']['total']:.1f}점</strong></li>
-            <li>금리 우대: <strong>{evaluation['financial_benefits']['discount_rate']}%p</strong></li>
-            <li>연간 절감: <strong>{evaluation['financial_benefits']['annual_savings']:.0f}억원</strong></li>
-        </ul>
-        <hr style="margin: 1.5rem 0;">
-        <h3 style="color: #333;">영역별 점수</h3>
-        <ul>
-            <li>환경(E): {evaluation['scores']['E']:.1f}점</li>
-            <li>사회(S): {evaluation['scores']['S']:.1f}점</li>
-            <li>거버넌스(G): {evaluation['scores']['G']:.1f}점</li>
-        </ul>
-    </div>
-    """
+    preview_html = render_report_preview(
+        company_name,
+        datetime.fromisoformat(evaluation['evaluation_date']).strftime('%Y년 %m월 %d일')
+    )
     
     st.markdown(preview_html, unsafe_allow_html=True)
     
@@ -789,43 +879,119 @@ def display_report_modal():
         st.rerun()
 
 def display_main_dashboard():
-    """메인 대시보드 - 트렌디한 탭 디자인"""
-    tabs = st.tabs([
-        "종합 대시보드",
-        "ESG 평가",
-        "AI 예측",
-        "금융상품",
-        "공급망",
-        "개선전략"
-    ])
-    
-    with tabs[0]:
-        display_executive_dashboard()
-    
-    with tabs[1]:
-        display_esg_evaluation()
-    
-    with tabs[2]:
-        if st.session_state.get('ai_enabled', False):
-            display_ai_predictions()
-        else:
-            st.info("AI 예측 기능을 활성화하려면 사이드바에서 옵션을 선택하세요.")
-    
-    with tabs[3]:
-        if st.session_state.get('financial_enabled', False):
-            display_financial_products()
-        else:
-            st.info("금융상품 매칭을 활성화하려면 사이드바에서 옵션을 선택하세요.")
+    """메인 대시보드 - 선택된 화면만 렌더링"""
+    # 화면 이름 -> (표시 함수, 활성화 플래그, 비활성 안내)
+    views = {
+        "종합 대시보드": (display_executive_dashboard, None, None),
+        "ESG 평가": (display_esg_evaluation, None, None),
+        "AI 예측": (display_ai_predictions, 'ai_enabled',
+                  "AI 예측 기능을 활성화하려면 사이드바에서 옵션을 선택하세요."),
+        "금융상품": (display_financial_products, 'financial_enabled',
+                 "금융상품 매칭을 활성화하려면 사이드바에서 옵션을 선택하세요."),
+        "공급망": (display_supply_chain, 'supply_chain_enabled',
+                "공급망 분석을 활성화하려면 사이드바에서 옵션을 선택하세요."),
+        "개선전략": (display_improvement_strategy, None, None)
+    }
     
-    with tabs[4]:
-        if st.session_state.get('supply_chain_enabled', False):
-            display_supply_chain()
-        else:
-            st.info("공급망 분석을 활성화하려면 사이드바에서 옵션을 선택하세요.")
+    selected = st.radio(
+        "화면 선택", list(views), horizontal=True,
+        key='active_tab', label_visibility="collapsed"
+    )
     
-    with tabs[5]:
-        display_improvement_strategy()
+    render, enabled_key, disabled_message = views[selected]
+    if enabled_key is None or st.session_state.get(enabled_key, False):
+        render()
+    else:
+        st.info(disabled_message)
+
+# 차트 공통 레이아웃 템플릿 (기본 plotly 템플릿 위에 합성)
+# 높이는 Streamlit 이 figure layout 에서 직접 읽으므로 차트별로 지정
+CHART_TEMPLATE_LAYOUTS = {
+    'esg_radar': dict(polar=dict(radialaxis=dict(visible=True, range=[0, 100]))),
+    'esg_trend': dict(showlegend=True),
+    'esg_prediction': dict(hovermode='x unified')
+}
+
+# 요약 차트 공통 설정 (툴바 제거)
+SUMMARY_CHART_CONFIG = {'displayModeBar': False}
+
+# 레이더 차트 축 (첫 영역으로 닫힘)
+RADAR_THETA = [name for name, _ in ESG_AREAS] + [ESG_AREAS[0][0]]
+
+@st.cache_resource
+def register_chart_templates() -> None:
+    """차트 템플릿 등록 및 JSON 엔진 설정 (프로세스당 1회)"""
+    import importlib.util
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    for name, layout in CHART_TEMPLATE_LAYOUTS.items():
+        pio.templates[name] = go.layout.Template(layout=layout)
+    
+    # orjson 설치 시 plotly JSON 직렬화에 사용
+    if importlib.util.find_spec("orjson") is not None:
+        pio.json.config.default_engine = "orjson"
 
+def chart_template(name: str) -> str:
+    """등록된 차트 템플릿 이름 조회"""
+    register_chart_templates()
+    return f"plotly+{name}"
+
+@st.cache_data(show_spinner=False)
+def build_score_gauge(total_score: float, bar_color: str) -> go.Figure:
+    """ESG 점수 게이지 차트 생성 (캐시)"""
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=total_score,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "ESG Score"},
+        delta={'reference': 70},
+        gauge={
+            'axis': {'range': [None, 100]},
+            'bar': {'color': bar_color},
+            'steps': [
+                {'range': [0, 65], 'color': "lightgray"},
+                {'range': [65, 80], 'color': "gray"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ), layout=dict(height=250))
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_esg_radar(e_score: float, s_score: float, g_score: float) -> go.Figure:
+    """영역별 레이더 차트 생성 (캐시)"""
+    import plotly.graph_objects as go
+    values = np.array([e_score, s_score, g_score])
+    
+    fig = go.Figure(data=go.Scatterpolar(
+        r=np.concatenate([values, values[:1]]),
+        theta=RADAR_THETA,
+        fill='toself',
+        name='ESG Score'
+    ), layout=dict(template=chart_template('esg_radar'), height=250, title="영역별 균형"))
+    return fig
+
+# WebGL(Scattergl) 전환 기준 포인트 수
+WEBGL_POINT_THRESHOLD = 1000
+
+def scatter_trace(n_points: int):
+    """포인트 수에 따른 Scatter 트레이스 선택"""
+    import plotly.graph_objects as go
+    return go.Scattergl if n_points > WEBGL_POINT_THRESHOLD else go.Scatter
+
+def cached_tab_figure(key: str, builder) -> go.Figure:
+    """탭 차트 세션 캐시 (새 평가 실행 시 초기화)"""
+    tab_cache = st.session_state.setdefault('tab_cache', {})
+    if key not in tab_cache:
+        tab_cache[key] = builder()
+    return tab_cache[key]
+
+@fragment
 def display_executive_dashboard():
     """경영진 대시보드"""
     st.markdown("## 대시보드")
@@ -854,46 +1020,24 @@ def display_executive_dashboard():
     
     with col1:
         # ESG 점수 게이지
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number+delta",
-            value=evaluation['scores']['total'],
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "ESG Score"},
-            delta={'reference': 70},
-            gauge={
-                'axis': {'range': [None, 100]},
-                'bar': {'color': engine.grade_system[evaluation['grade']]['color']},
-                'steps': [
-                    {'range': [0, 65], 'color': "lightgray"},
-                    {'range': [65, 80], 'color': "gray"}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 90
-                }
-            }
-        ))
-        fig.update_layout(height=250)
-        st.plotly_chart(fig, use_container_width=True)
+        fig = build_score_gauge(
+            evaluation['scores']['total'],
+            grade_color(evaluation['grade'])
+        )
+        st.plotly_chart(
+            fig, use_container_width=True,
+            config=SUMMARY_CHART_CONFIG
+        )
     
     with col2:
         # 영역별 레이더 차트
-        categories = ['E', 'S', 'G']
-        values = [evaluation['scores']['E'], evaluation['scores']['S'], evaluation['scores']['G']]
-        
-        fig = go.Figure(data=go.Scatterpolar(
-            r=values + [values[0]],
-            theta=['환경', '사회', '거버넌스', '환경'],
-            fill='toself',
-            name='ESG Score'
-        ))
-        fig.update_layout(
-            polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
-            height=250,
-            title="영역별 균형"
+        fig = build_esg_radar(
+            evaluation['scores']['E'], evaluation['scores']['S'], evaluation['scores']['G']
+        )
+        st.plotly_chart(
+            fig, use_container_width=True,
+            config=SUMMARY_CHART_CONFIG
         )
-        st.plotly_chart(fig, use_container_width=True)
     
     with col3:
         # 재무 영향
@@ -922,28 +1066,61 @@ def display_executive_dashboard():
     if 'ai_predictions' in st.session_state:
         st.markdown("### 성과 트렌드 및 예측")
         
-        historical = st.session_state.ai_predictions['historical']
-        predictions = st.session_state.ai_predictions['predictions']
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=historical['date'], y=historical['total'],
-            mode='lines+markers', name='실적',
+        fig = cached_tab_figure(
+            "exec_trend", lambda: build_trend_figure(st.session_state.ai_predictions)
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+def history_forecast_traces(predictions_data: Dict, history_name: str) -> List:
+    """실적/예측 트레이스 생성"""
+    historical = predictions_data['historical']
+    predictions = predictions_data['predictions']
+    
+    # datetime64/float 배열로 직접 전달 (Series·datetime 객체 변환 생략)
+    # float32 점수는 소수 둘째 자리로 반올림해 JSON 길이 축소
+    series = []
+    for frame in (historical, predictions):
+        dates = frame['date'].to_numpy(dtype='datetime64[ns]')
+        totals = np.round(frame['total'].to_numpy(dtype=np.float64), 2)
+        idx = lttb_indices(totals)
+        series.append((dates[idx], totals[idx]))
+    (hist_x, hist_y), (pred_x, pred_y) = series
+    
+    trace = scatter_trace(len(historical) + len(predictions))
+    return [
+        trace(
+            x=hist_x, y=hist_y,
+            mode='lines+markers', name=history_name,
             line=dict(color='blue', width=2)
-        ))
-        fig.add_trace(go.Scatter(
-            x=predictions['date'], y=predictions['total'],
+        ),
+        trace(
+            x=pred_x, y=pred_y,
             mode='lines+markers', name='AI 예측',
             line=dict(color='red', width=2, dash='dash')
-        ))
-        fig.add_hline(y=80, line_dash="dot", line_color="green",
-                     annotation_text="목표 (A- 등급)")
-        
-        fig.update_layout(
-            xaxis_title="기간", yaxis_title="ESG 점수",
-            height=300, showlegend=True
         )
-        st.plotly_chart(fig, use_container_width=True)
+    ]
+
+def build_trend_figure(predictions_data: Dict) -> go.Figure:
+    """성과 트렌드 차트 생성"""
+    import plotly.graph_objects as go
+    fig = go.Figure(
+        data=history_forecast_traces(predictions_data, '실적'),
+        layout=dict(
+            template=chart_template('esg_trend'), height=300,
+            xaxis_title="기간", yaxis_title="ESG 점수"
+        )
+    )
+    fig.add_hline(y=80, line_dash="dot", line_color="green",
+                 annotation_text="목표 (A- 등급)")
+    return fig
+
+def render_metric_grid(items: List):
+    """메트릭 카드 묶음을 단일 마크다운으로 표시"""
+    cards = "".join(
+        METRIC_CARD_HTML.format(label=label, value=value, delta=delta)
+        for label, value, delta in items
+    )
+    st.markdown(f'<div class="metric-grid">{cards}</div>', unsafe_allow_html=True)
 
 def display_esg_evaluation():
     """ESG 평가 상세"""
@@ -952,39 +1129,26 @@ def display_esg_evaluation():
     evaluation = st.session_state.evaluation_result
     
     # 점수 요약
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("환경(E)", f"{evaluation['scores']['E']:.1f}점",
-                 "우수" if evaluation['scores']['E'] >= 80 else "보통")
-    with col2:
-        st.metric("사회(S)", f"{evaluation['scores']['S']:.1f}점",
-                 "우수" if evaluation['scores']['S'] >= 80 else "보통")
-    with col3:
-        st.metric("거버넌스(G)", f"{evaluation['scores']['G']:.1f}점",
-                 "우수" if evaluation['scores']['G'] >= 80 else "보통")
-    with col4:
-        st.metric("종합", f"{evaluation['scores']['total']:.1f}점",
-                 evaluation['grade'])
+    scores = evaluation['scores']
+    render_metric_grid(
+        [(f"{name}({area})", f"{scores[area]:.1f}점", "우수" if scores[area] >= 80 else "보통")
+         for name, area in ESG_AREAS]
+        + [("종합", f"{scores['total']:.1f}점", evaluation['grade'])]
+    )
     
     # 상세 분석
     st.markdown("### 영역별 상세 분석")
     
-    tab1, tab2, tab3 = st.tabs(["환경", "사회", "거버넌스"])
-    
-    with tab1:
-        display_environmental_details(evaluation['details']['E'])
-    
-    with tab2:
-        display_social_details(evaluation['details']['S'])
-    
-    with tab3:
-        display_governance_details(evaluation['details']['G'])
+    area_tabs = st.tabs([name for name, _ in ESG_AREAS])
+    for tab, (_, area) in zip(area_tabs, ESG_AREAS):
+        with tab:
+            display_area_details(evaluation['flat_scores'][area])
     
     # 규제 준수
     st.markdown("### 규제 준수 현황")
     display_compliance_status(evaluation['compliance'])
 
+@fragment
 def display_ai_predictions():
     """AI 예측 결과"""
     st.markdown("## AI 예측 분석")
@@ -1006,8 +1170,7 @@ def display_ai_predictions():
     with col3:
         st.metric("예측 기간", st.session_state.prediction_period)
     with col4:
-        final_score = predictions_data['predictions'].iloc[-1]['total']
-        st.metric("예상 점수", f"{final_score:.1f}")
+        st.metric("예상 점수", f"{predictions_data['final_total']:.1f}")
     
     # 예측 차트
     display_prediction_chart(predictions_data)
@@ -1039,6 +1202,7 @@ def display_financial_products():
     # 상품 목록
     display_product_list(matched)
 
+@fragment
 def display_supply_chain():
     """공급망 분석"""
     st.markdown("## 공급망 ESG 분석")
@@ -1066,7 +1230,7 @@ def display_improvement_strategy():
     evaluation = st.session_state.evaluation_result
     
     # 로드맵 생성
-    roadmap = create_improvement_roadmap(evaluation)
+    roadmap = cached_roadmap(evaluation['scores']['total'])
     
     # 단계별 전략
     st.markdown("### ESG 개선 로드맵")
@@ -1078,8 +1242,7 @@ def display_improvement_strategy():
             with col1:
                 st.write(f"**목표**: {phase['target']}")
                 st.write("**주요 활동**:")
-                for activity in phase['activities']:
-                    st.write(f"• {activity}")
+                st.markdown(bullet_markdown(phase['activities']))
             
             with col2:
                 st.write(f"**투자**: {phase['investment']}억원")
@@ -1088,70 +1251,44 @@ def display_improvement_strategy():
     # 시나리오 분석
     display_scenario_analysis(evaluation)
 
-def display_welcome_screen():
-    """환영 화면 - 모던 디자인"""
-    st.markdown("""
-    <div class="fade-in" style="text-align: center; padding: 3rem 1rem;">
-        <h1 style="font-size: 3rem; color: #0046FF; margin-bottom: 1rem;">
-            Welcome to ShinhanESG
-        </h1>
-        <p style="font-size: 1.3rem; color: #666; margin-bottom: 3rem;">
-            AI 기반 대기업 ESG 통합관리 플랫폼
-        </p>
+# 환영 화면 (정적 HTML)
+WELCOME_HTML = """
+<div class="fade-in" style="text-align: center; padding: 3rem 1rem;">
+    <h1 style="font-size: 3rem; color: #0046FF; margin-bottom: 1rem;">
+        Welcome to ShinhanESG
+    </h1>
+    <p style="font-size: 1.3rem; color: #666; margin-bottom: 3rem;">
+        AI 기반 대기업 ESG 통합관리 플랫폼
+    </p>
+</div>
+<div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;">
+    <div class="metric-card" style="text-align: center;">
+        <h4 style="margin-bottom: 0.5rem;">ESG 평가</h4>
+        <p style="color: #666; font-size: 0.9rem;">신한은행 7등급 체계<br>정밀 평가</p>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Feature Cards
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
-        <div class="metric-card" style="text-align: center;">
-            <h4 style="margin-bottom: 0.5rem;">ESG 평가</h4>
-            <p style="color: #666; font-size: 0.9rem;">
-                신한은행 7등급 체계<br>정밀 평가
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="metric-card" style="text-align: center;">
-            <h4 style="margin-bottom: 0.5rem;">AI 예측</h4>
-            <p style="color: #666; font-size: 0.9rem;">
-                머신러닝 기반<br>미래 성과 예측
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="metric-card" style="text-align: center;">
-            <h4 style="margin-bottom: 0.5rem;">금융 솔루션</h4>
-            <p style="color: #666; font-size: 0.9rem;">
-                맞춤형 ESG<br>금융상품 매칭
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="metric-card" style="text-align: center;">
-            <h4 style="margin-bottom: 0.5rem;">공급망 분석</h4>
-            <p style="color: #666; font-size: 0.9rem;">
-                Scope 3 배출량<br>리스크 평가
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # CTA
-    st.markdown("""
-    <div style="text-align: center; margin-top: 3rem;">
-        <p style="font-size: 1.1rem; color: #333;">
-            좌측 사이드바에서 기업을 선택하고 평가를 시작하세요
-        </p>
+    <div class="metric-card" style="text-align: center;">
+        <h4 style="margin-bottom: 0.5rem;">AI 예측</h4>
+        <p style="color: #666; font-size: 0.9rem;">머신러닝 기반<br>미래 성과 예측</p>
     </div>
-    """, unsafe_allow_html=True)
+    <div class="metric-card" style="text-align: center;">
+        <h4 style="margin-bottom: 0.5rem;">금융 솔루션</h4>
+        <p style="color: #666; font-size: 0.9rem;">맞춤형 ESG<br>금융상품 매칭</p>
+    </div>
+    <div class="metric-card" style="text-align: center;">
+        <h4 style="margin-bottom: 0.5rem;">공급망 분석</h4>
+        <p style="color: #666; font-size: 0.9rem;">Scope 3 배출량<br>리스크 평가</p>
+    </div>
+</div>
+<div style="text-align: center; margin-top: 3rem;">
+    <p style="font-size: 1.1rem; color: #333;">
+        좌측 사이드바에서 기업을 선택하고 평가를 시작하세요
+    </p>
+</div>
+"""
+
+def display_welcome_screen():
+    """환영 화면 - 모던 디자인"""
+    st.markdown(WELCOME_HTML, unsafe_allow_html=True)
 
 def display_modern_footer():
     """모던 푸터"""
@@ -1171,6 +1308,21 @@ def display_modern_footer():
     </div>
     """, unsafe_allow_html=True)
 
+# 자동 재생 간격 (밀리초)
+AUTO_PLAY_DELAY_MS = 5000
+
+# 자동 재생 타이머 (슬라이드 번호로 iframe을 매번 새로 그림)
+AUTO_PLAY_SCRIPT = """
+<script>
+    // slide {slide}
+    setTimeout(function() {{
+        var buttons = window.parent.document.querySelectorAll('button');
+        var next = Array.from(buttons).find(function(b) {{ return b.innerText.includes('다음 ▶'); }});
+        if (next && !next.disabled) {{ next.click(); }}
+    }}, {delay});
+</script>
+"""
+
 def display_presentation_mode():
     """프레젠테이션 모드"""
     if 'evaluation_result' not in st.session_state:
@@ -1180,7 +1332,7 @@ def display_presentation_mode():
     
     # 슬라이드 생성
     if 'presentation_slides' not in st.session_state:
-        st.session_state.presentation_slides = presentation_mode.create_presentation(
+        st.session_state.presentation_slides = get_presentation_mode().create_presentation(
             st.session_state.evaluation_result,
             st.session_state.get('ai_predictions'),
             st.session_state.get('matched_products'),
@@ -1293,7 +1445,7 @@ def display_presentation_mode():
     # 슬라이드 내용 (상단 여백 추가)
     st.markdown("<div style='margin-top: 1rem;'></div>", unsafe_allow_html=True)
     with container:
-        presentation_mode.render_slide(slides[current_slide])
+        get_presentation_mode().render_slide(slides[current_slide])
     
     # 하단 컨트롤
     st.markdown("---")
@@ -1302,11 +1454,9 @@ def display_presentation_mode():
     
     with col1:
         # 자동 재생
-        if st.checkbox("자동 재생", key="auto_play"):
-            time.sleep(5)  # 5초 후 다음 슬라이드
-            if current_slide < len(slides) - 1:
-                st.session_state.current_slide = current_slide + 1
-                st.rerun()
+        if st.checkbox("자동 재생", key="auto_play") and current_slide < len(slides) - 1:
+            # 브라우저 타이머가 5초 후 '다음' 버튼을 누름 (서버 스레드 대기 없음)
+            components.html(AUTO_PLAY_SCRIPT.format(slide=current_slide, delay=AUTO_PLAY_DELAY_MS), height=0)
     
     with col2:
         # 슬라이드 선택
@@ -1337,146 +1487,196 @@ def execute_evaluation(enterprise_data, selected_enterprise,
     # 1. 기본 평가
     status_text.text("ESG 평가 진행 중...")
     progress_bar.progress(20)
-    evaluation = engine.evaluate_enterprise(enterprise_data)
-    st.session_state.evaluation_result = evaluation
-    st.session_state.selected_enterprise = selected_enterprise
-    st.session_state.enterprise_data = enterprise_data
+    evaluation = evaluate_enterprise_cached(selected_enterprise)
+    # 평가일은 캐시 밖에서 실행 시점으로 기록 (캐시 값은 호출마다 복사본)
+    evaluation['evaluation_date'] = datetime.now().isoformat()
+    
+    # 세션 상태 반영분 (마지막에 한 번에 기록)
+    results = {
+        'tab_cache': {},
+        'evaluation_result': evaluation,
+        'selected_enterprise': selected_enterprise,
+        'enterprise_data': enterprise_data
+    }
     
-    # 2. AI 예측
+    # 2. 후속 분석 (AI 예측 / 금융상품 매칭 / 공급망 분석)
+    # 워커에는 평가 결과 대신 필요한 불변 값(점수 튜플·등급)만 전달
+    jobs = {}
     if enable_ai:
-        status_text.text("AI 예측 분석 중...")
-        progress_bar.progress(40)
-        st.session_state.ai_enabled = True
-        st.session_state.prediction_period = prediction_period
-        perform_ai_prediction(evaluation)
-    
-    # 3. 금융상품 매칭
+        results['ai_enabled'] = True
+        results['prediction_period'] = prediction_period
+        jobs["AI 예측 분석"] = (perform_ai_prediction, (
+            tuple(evaluation['scores'].items()), evaluation['grade'], selected_enterprise, prediction_period
+        ))
     if enable_financial:
-        status_text.text("금융상품 매칭 중...")
-        progress_bar.progress(60)
-        st.session_state.financial_enabled = True
-        perform_financial_matching(enterprise_data, evaluation)
-    
-    # 4. 공급망 분석
+        results['financial_enabled'] = True
+        jobs["금융상품 매칭"] = (perform_financial_matching, (selected_enterprise,))
     if enable_supply_chain:
-        status_text.text("공급망 분석 중...")
-        progress_bar.progress(80)
-        st.session_state.supply_chain_enabled = True
-        perform_supply_chain_analysis(enterprise_data)
-    
-    # 완료
-    progress_bar.progress(100)
-    status_text.text("평가 완료!")
-    time.sleep(1)
+        results['supply_chain_enabled'] = True
+        jobs["공급망 분석"] = (perform_supply_chain_analysis, (selected_enterprise,))
+    
+    # 서로 독립적이므로 병렬 실행 (워커는 세션 상태에 쓰지 않고 결과만 반환)
+    if jobs:
+        status_text.text(f"{', '.join(jobs)} 중...")
+        with ThreadPoolExecutor(max_workers=len(jobs), initializer=add_script_run_ctx,
+                                initargs=(None, get_script_run_ctx())) as executor:
+            futures = {executor.submit(func, *args): label for label, (func, args) in jobs.items()}
+            for done, future in enumerate(as_completed(futures), 1):
+                results.update(future.result())
+                status_text.text(f"{futures[future]} 완료")
+                progress_bar.progress(20 + 70 * done // len(futures))
+    
+    # 이전 평가 기준 슬라이드 무효화 후 결과 일괄 반영
+    st.session_state.pop('presentation_slides', None)
+    st.session_state.update(results)
+    
+    # 완료 (대기 없이 바로 정리하고 토스트로 알림)
     progress_bar.empty()
     status_text.empty()
-    
-    st.success("모든 평가가 성공적으로 완료되었습니다!")
-    st.balloons()
+    st.toast("평가 완료!", icon="✅")
     
     # 페이지 새로고침으로 헤더 업데이트
     st.rerun()
 
-def perform_ai_prediction(evaluation: Dict):
-    """AI 예측 수행"""
-    current_scores = evaluation['scores']
-    company_name = st.session_state.get('selected_enterprise', None)
-    historical_data = ai_predictor.generate_historical_data(current_scores, periods=24, company_name=company_name)
-    ai_predictor.train_prediction_model(historical_data)
+@st.cache_resource(ttl=3600, show_spinner=False, max_entries=32)
+def train_predictor(scores_items: tuple, company_name: Optional[str]):
+    """과거 데이터 생성 + 모델 학습 (점수/기업 기준 캐시, 예측 기간과 무관)"""
+    from src.ai_prediction_finance import AIPredictor
+    predictor = AIPredictor()
+    historical_data = predictor.generate_historical_data(dict(scores_items), periods=24, company_name=company_name)
+    predictor.train_prediction_model(historical_data)
+    return predictor, historical_data
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def compute_ai_bundle(scores_items: tuple, grade: str, company_name: Optional[str], periods: int) -> Dict:
+    """AI 예측 파이프라인 (점수/기업/예측기간 기준 캐시)"""
+    current_scores = dict(scores_items)
+    predictor, historical_data = train_predictor(scores_items, company_name)
     
-    period_map = {"3개월": 3, "6개월": 6, "1년": 12, "3년": 36}
-    periods = period_map.get(st.session_state.prediction_period, 12)
+    predictions = predictor.predict_future_scores(historical_data, periods=periods, company_name=company_name)
+    target_grade = "A" if grade.startswith("B") else "A+"
+    improvement_analysis = predictor.analyze_improvement_drivers(current_scores, target_grade)
     
-    predictions = ai_predictor.predict_future_scores(historical_data, periods=periods, company_name=company_name)
-    target_grade = "A" if evaluation['grade'].startswith("B") else "A+"
-    improvement_analysis = ai_predictor.analyze_improvement_drivers(current_scores, target_grade)
+    # 세션 저장용 점수 컬럼 float32 축소 (신뢰도·최종 점수는 원본 정밀도로 계산)
+    score_dtypes = dict.fromkeys(['E', 'S', 'G', 'total'], np.float32)
     
-    st.session_state.ai_predictions = {
-        'historical': historical_data,
-        'predictions': predictions,
+    return {
+        'historical': historical_data.astype(score_dtypes),
+        'predictions': predictions.astype(score_dtypes),
         'improvement_analysis': improvement_analysis,
-        'confidence': ai_predictor.get_prediction_confidence(predictions)
+        'confidence': predictor.get_prediction_confidence(predictions),
+        'final_total': float(predictions['total'].iat[-1])
     }
 
-def perform_financial_matching(company_data: Dict, evaluation: Dict):
-    """금융상품 매칭 수행"""
-    matched_products = product_matcher.match_products(company_data, evaluation)
-    st.session_state.matched_products = matched_products
+def perform_ai_prediction(scores_items: tuple, grade: str, company_name: str, prediction_period: str) -> Dict:
+    """AI 예측 수행"""
+    periods = PERIOD_MAP.get(prediction_period, 12)
     
-    financing_needs = {'total_amount': 1000}
+    return {
+        'ai_predictions': compute_ai_bundle(scores_items, grade, company_name, periods)
+    }
+
+# 금융 패키지 구성 기본 자금 소요 (억원)
+DEFAULT_FINANCING_NEEDS = MappingProxyType({'total_amount': 1000})
+
+@st.cache_data(show_spinner=False)
+def perform_financial_matching(company_name: str) -> Dict:
+    """금융상품 매칭 수행 (기업명 기준 캐시)"""
+    company_data = load_enterprise_data(company_name)
+    evaluation = evaluate_enterprise_cached(company_name)
+    
+    product_matcher = get_product_matcher()
+    matched_products = product_matcher.match_products(company_data, evaluation)
     package = product_matcher.create_financing_package(
-        company_data, evaluation, financing_needs
+        company_data, evaluation, DEFAULT_FINANCING_NEEDS
     )
-    st.session_state.financing_package = package
+    
+    return {
+        'matched_products': matched_products,
+        'financing_package': package
+    }
+
+# 공급망 회복탄력성 기본 입력 (읽기 전용)
+DEFAULT_RESILIENCE_INPUT = MappingProxyType({
+    'total_suppliers': 100,
+    'regions': ('Korea', 'China', 'Japan', 'USA')
+})
 
-def perform_supply_chain_analysis(company_data: Dict):
-    """공급망 분석 수행"""
+@st.cache_data(show_spinner=False)
+def perform_supply_chain_analysis(company_name: str) -> Dict:
+    """공급망 분석 수행 (기업명 기준 캐시)"""
+    company_data = load_enterprise_data(company_name)
+    supply_chain_analyzer = get_supply_chain_analyzer()
     scope3_emissions = supply_chain_analyzer.calculate_scope3_emissions(company_data)
     risk_assessment = supply_chain_analyzer.assess_supplier_risks(company_data)
-    resilience = supply_chain_analyzer.analyze_supply_chain_resilience(
-        {'total_suppliers': 100, 'regions': ['Korea', 'China', 'Japan', 'USA']}
-    )
+    resilience = supply_chain_analyzer.analyze_supply_chain_resilience(DEFAULT_RESILIENCE_INPUT)
     
-    st.session_state.supply_chain_analysis = {
-        'scope3_emissions': scope3_emissions,
-        'risk_assessment': risk_assessment,
-        'resilience': resilience
+    return {
+        'supply_chain_analysis': {
+            'scope3_emissions': scope3_emissions,
+            'risk_assessment': risk_assessment,
+            'resilience': resilience
+        }
     }
 
-def display_environmental_details(details: Dict):
-    """환경 상세 표시"""
-    for key, value in details.items():
-        if isinstance(value, dict) and 'score' in value:
-            st.metric(key.replace('_', ' ').title(), f"{value['score']:.1f}점")
+# 영역별 상세 테이블 컬럼 설정
+AREA_DETAIL_COLUMN_CONFIG = {
+    'indicator': st.column_config.TextColumn('지표'),
+    'score': st.column_config.ProgressColumn('점수', min_value=0, max_value=100, format="%.1f점")
+}
 
-def display_social_details(details: Dict):
-    """사회 상세 표시"""
-    for key, value in details.items():
-        if isinstance(value, dict) and 'score' in value:
-            st.metric(key.replace('_', ' ').title(), f"{value['score']:.1f}점")
+def display_area_details(scores: List):
+    """영역별 상세 표시 (지표별 점수를 한 번의 테이블로 렌더링)"""
+    st.dataframe(
+        pd.DataFrame.from_records(scores, columns=list(AREA_DETAIL_COLUMN_CONFIG)),
+        column_config=AREA_DETAIL_COLUMN_CONFIG,
+        hide_index=True,
+        use_container_width=True
+    )
 
-def display_governance_details(details: Dict):
-    """거버넌스 상세 표시"""
-    for key, value in details.items():
-        if isinstance(value, dict) and 'score' in value:
-            st.metric(key.replace('_', ' ').title(), f"{value['score']:.1f}점")
+@st.cache_data(show_spinner=False)
+def build_compliance_frame(compliance: Dict) -> pd.DataFrame:
+    """규제 준수 테이블 생성 (재실행 시 캐시 재사용)"""
+    return pd.DataFrame({
+        "규제": list(COMPLIANCE_STANDARDS),
+        "상태": [compliance[name]['status'] for name in COMPLIANCE_STANDARDS],
+        "준수": ["준수" if compliance[name]['compliant'] else "미준수" for name in COMPLIANCE_STANDARDS]
+    })
 
 def display_compliance_status(compliance: Dict):
     """규제 준수 상태 표시"""
-    df = pd.DataFrame([
-        {"규제": "K-Taxonomy", "상태": compliance['K-Taxonomy']['status'],
-         "준수": "준수" if compliance['K-Taxonomy']['compliant'] else "미준수"},
-        {"규제": "TCFD", "상태": compliance['TCFD']['status'],
-         "준수": "준수" if compliance['TCFD']['compliant'] else "미준수"},
-        {"규제": "GRI", "상태": compliance['GRI']['status'],
-         "준수": "준수" if compliance['GRI']['compliant'] else "미준수"}
-    ])
+    df = build_compliance_frame(compliance)
     st.dataframe(df, hide_index=True, use_container_width=True)
 
+def build_prediction_figure(predictions_data: Dict) -> go.Figure:
+    """예측 차트 생성"""
+    import plotly.graph_objects as go
+    return go.Figure(
+        data=history_forecast_traces(predictions_data, '과거 실적'),
+        layout=dict(
+            template=chart_template('esg_prediction'), height=400,
+            title="ESG 점수 예측",
+            xaxis_title="날짜", yaxis_title="ESG 점수"
+        )
+    )
+
 def display_prediction_chart(predictions_data: Dict):
     """예측 차트 표시"""
-    historical = predictions_data['historical']
-    predictions = predictions_data['predictions']
-    
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=historical['date'], y=historical['total'],
-        mode='lines+markers', name='과거 실적',
-        line=dict(color='blue', width=2)
-    ))
-    fig.add_trace(go.Scatter(
-        x=predictions['date'], y=predictions['total'],
-        mode='lines+markers', name='AI 예측',
-        line=dict(color='red', width=2, dash='dash')
-    ))
-    
-    fig.update_layout(
-        title="ESG 점수 예측",
-        xaxis_title="날짜", yaxis_title="ESG 점수",
-        height=400, hovermode='x unified'
-    )
+    fig = cached_tab_figure("prediction_chart", lambda: build_prediction_figure(predictions_data))
     st.plotly_chart(fig, use_container_width=True)
 
+# AI 추천 개선 전략 카드
+RECOMMENDATION_CARD_HTML = """
+<div class="recommendation-card">
+    <h4>{idx}. {factor}</h4>
+    <div style="display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 1rem; margin-top: 1rem;">
+        <div><strong>예상 개선</strong><br>+{impact:.1f}점</div>
+        <div><strong>투자 비용</strong><br>{cost}억원</div>
+        <div><strong>소요 기간</strong><br>{time}개월</div>
+    </div>
+</div>
+"""
+
 def display_ai_improvement_strategy(predictions_data: Dict):
     """AI 개선 전략 표시"""
     improvement = predictions_data['improvement_analysis']
@@ -1484,26 +1684,17 @@ def display_ai_improvement_strategy(predictions_data: Dict):
     if improvement['status'] == 'success':
         st.markdown("### AI 추천 개선 전략")
         
-        for idx, rec in enumerate(improvement['recommendations'][:3], 1):
-            st.markdown(f"""
-            <div class="recommendation-card">
-                <h4>{idx}. {rec['factor'].replace('_', ' ').title()}</h4>
-                <div style="display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 1rem; margin-top: 1rem;">
-                    <div>
-                        <strong>예상 개선</strong><br>
-                        +{rec['impact']:.1f}점
-                    </div>
-                    <div>
-                        <strong>투자 비용</strong><br>
-                        {rec['cost']}억원
-                    </div>
-                    <div>
-                        <strong>소요 기간</strong><br>
-                        {rec['time']}개월
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        cards = "".join(
+            RECOMMENDATION_CARD_HTML.format(
+                idx=idx,
+                factor=rec['factor'].replace('_', ' ').title(),
+                impact=rec['impact'],
+                cost=rec['cost'],
+                time=rec['time']
+            )
+            for idx, rec in enumerate(improvement['recommendations'][:3], 1)
+        )
+        st.markdown(cards, unsafe_allow_html=True)
 
 def display_product_list(matched: Dict):
     """금융상품 목록 표시"""
@@ -1518,8 +1709,7 @@ def display_product_list(matched: Dict):
             with col2:
                 st.metric("연간 절감", f"{loan['annual_savings']:.1f}억원")
                 st.write("**주요 특징**:")
-                for feature in loan['features'][:2]:
-                    st.write(f"• {feature}")
+                st.markdown(bullet_markdown(loan['features'][:2]))
 
 def display_scope3_analysis(scope3: Dict):
     """Scope 3 분석 표시"""
@@ -1556,6 +1746,47 @@ def display_supply_resilience(resilience: Dict):
         st.metric("회복력 등급", resilience['resilience_grade'])
     with col3:
         st.metric("위기 대응력", resilience['resilience_level'])
+    
+    # 요인별 점수 (명시적 컬럼으로 dtype 추론 생략)
+    rows = [
+        (name.replace('_', ' ').title(), factor['score'], factor['status'])
+        for name, factor in resilience['factor_scores'].items()
+    ]
+    st.dataframe(
+        pd.DataFrame.from_records(rows, columns=['요인', '점수', '상태']),
+        hide_index=True, use_container_width=True
+    )
+
+# 개선 로드맵 단계 (목표 문구만 점수에 따라 달라짐)
+ROADMAP_PHASES = (
+    {
+        'phase': 1,
+        'name': 'Quick Wins',
+        'timeline': '0-3개월',
+        'activities': ('ESG 위원회 설립', '정책 수립', '데이터 체계 구축'),
+        'investment': 50,
+        'expected_outcome': '기반 구축'
+    },
+    {
+        'phase': 2,
+        'name': 'Foundation',
+        'timeline': '3-12개월',
+        'activities': ('탄소 측정 시스템', '공급망 평가', 'ESG 교육'),
+        'investment': 200,
+        'expected_outcome': 'B+ 등급'
+    },
+    {
+        'phase': 3,
+        'name': 'Excellence',
+        'timeline': '12-24개월',
+        'activities': ('재생에너지 50%', 'ESG 인증', 'Net Zero 선언'),
+        'investment': 500,
+        'expected_outcome': 'ESG 리더'
+    }
+)
+
+# 단계별 목표 (문구 형식, 현재 점수 대비 가산점)
+ROADMAP_TARGETS = (('점수 {score:.0f}점 달성', 5), ('점수 {score:.0f}점 달성', 10), ('A- 등급', 0))
 
 def create_improvement_roadmap(evaluation: Dict) -> Dict:
     """개선 로드맵 생성"""
@@ -1563,48 +1794,35 @@ def create_improvement_roadmap(evaluation: Dict) -> Dict:
     
     return {
         'phases': [
-            {
-                'phase': 1,
-                'name': 'Quick Wins',
-                'timeline': '0-3개월',
-                'target': f'점수 {current_score + 5:.0f}점 달성',
-                'activities': [
-                    'ESG 위원회 설립',
-                    '정책 수립',
-                    '데이터 체계 구축'
-                ],
-                'investment': 50,
-                'expected_outcome': '기반 구축'
-            },
-            {
-                'phase': 2,
-                'name': 'Foundation',
-                'timeline': '3-12개월',
-                'target': f'점수 {current_score + 10:.0f}점 달성',
-                'activities': [
-                    '탄소 측정 시스템',
-                    '공급망 평가',
-                    'ESG 교육'
-                ],
-                'investment': 200,
-                'expected_outcome': 'B+ 등급'
-            },
-            {
-                'phase': 3,
-                'name': 'Excellence',
-                'timeline': '12-24개월',
-                'target': 'A- 등급',
-                'activities': [
-                    '재생에너지 50%',
-                    'ESG 인증',
-                    'Net Zero 선언'
-                ],
-                'investment': 500,
-                'expected_outcome': 'ESG 리더'
-            }
+            {**phase, 'target': target.format(score=current_score + delta)}
+            for phase, (target, delta) in zip(ROADMAP_PHASES, ROADMAP_TARGETS)
         ]
     }
 
+@st.cache_data(show_spinner=False, max_entries=128)
+def cached_roadmap(total_score: float) -> Dict:
+    """개선 로드맵 (총점 기준 캐시)"""
+    return create_improvement_roadmap({'scores': {'total': total_score}})
+
+# 시나리오 표 컬럼 표시 형식 (브라우저 측 포맷팅)
+SCENARIO_COLUMN_CONFIG = {
+    'scenario': st.column_config.TextColumn('시나리오'),
+    'new_score': st.column_config.ProgressColumn('예상 점수', min_value=0, max_value=100, format="%.1f"),
+    'score_change': st.column_config.NumberColumn('점수 변화', format="%+.1f"),
+    'new_grade': st.column_config.TextColumn('예상 등급'),
+    'rate_discount': st.column_config.NumberColumn('금리 우대', format="%.1f%%p"),
+    'annual_savings': st.column_config.NumberColumn('연간 절감', format="%.0f억원"),
+    'investment': st.column_config.NumberColumn('투자', format="%.0f억원"),
+    'roi': st.column_config.NumberColumn('ROI', format="%.0f%%")
+}
+
+@st.cache_data(show_spinner=False)
+def compute_scenario_results(scores_items: tuple) -> pd.DataFrame:
+    """프리셋 시나리오 분석 (점수 기준 캐시)"""
+    return get_ai_predictor().generate_scenario_analysis_vec(
+        dict(scores_items), SCENARIO_IMPACTS, SCENARIO_INVESTMENTS, SCENARIO_NAMES
+    )
+
 def display_scenario_analysis(evaluation: Dict):
     """시나리오 분석 표시"""
     if 'ai_predictions' not in st.session_state:
@@ -1612,28 +1830,13 @@ def display_scenario_analysis(evaluation: Dict):
     
     st.markdown("### 시나리오 분석")
     
-    scenarios = ai_predictor.generate_scenario_analysis(
-        evaluation['scores'],
-        [
-            {'name': '보수적', 'improvements': [
-                {'area': 'E', 'impact': 5},
-                {'area': 'S', 'impact': 3},
-                {'area': 'G', 'impact': 2}
-            ], 'investment': 200},
-            {'name': '중도적', 'improvements': [
-                {'area': 'E', 'impact': 10},
-                {'area': 'S', 'impact': 8},
-                {'area': 'G', 'impact': 7}
-            ], 'investment': 500},
-            {'name': '공격적', 'improvements': [
-                {'area': 'E', 'impact': 20},
-                {'area': 'S', 'impact': 15},
-                {'area': 'G', 'impact': 15}
-            ], 'investment': 1000}
-        ]
-    )
+    scenarios = compute_scenario_results(tuple(evaluation['scores'].items()))
     
-    st.dataframe(scenarios, use_container_width=True)
+    st.dataframe(
+        scenarios,
+        column_config=SCENARIO_COLUMN_CONFIG,
+        hide_index=True, use_container_width=True
+    )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,12 +6,17 @@ import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
-from sklearn.linear_model import LinearRegression
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import StandardScaler
 import warnings
+import zlib
 warnings.filterwarnings('ignore')
 
+# 난수 스트림 구분 (같은 기업이라도 과거 생성과 미래 예측은 독립 스트림 사용)
+HISTORY_STREAM = 0
+FORECAST_STREAM = 1
+
+# ESG 영역 -> 점수 배열 열 인덱스
+AREA_INDEX = {'E': 0, 'S': 1, 'G': 2}
+
 class AIPredictor:
     """AI 기반 ESG 예측 엔진"""
     
@@ -54,6 +59,12 @@ class AIPredictor:
             }
         }
     
+    @staticmethod
+    def _rng(company_name: Optional[str] = None, stream: int = HISTORY_STREAM) -> np.random.Generator:
+        """기업명·스트림 기반 독립 난수 생성기 (전역 난수 상태를 쓰지 않아 병렬 실행에도 재현 가능)"""
+        seed = zlib.crc32(company_name.encode('utf-8')) if company_name else 42
+        return np.random.default_rng([seed, stream])
+    
     def generate_historical_data(self, current_scores: Dict, periods: int = 24, company_name: str = None) -> pd.DataFrame:
         """과거 데이터 시뮬레이션 생성
         
@@ -152,165 +163,113 @@ class AIPredictor:
         # 기업별 패턴 선택
         pattern = company_patterns.get(company_name, default_pattern)
         
-        # 랜덤 시드를 기업명 기반으로 설정 (일관성 유지하면서 다양성 확보)
-        if company_name:
-            np.random.seed(hash(company_name) % 2**32)
-        else:
-            np.random.seed(42)
-        
-        data = []
+        # 기업명 기반 난수 생성기 (일관성 유지하면서 다양성 확보)
+        rng = self._rng(company_name, HISTORY_STREAM)
         
         # 초기 점수 설정 (현재 점수 기준으로 과거로 갈수록 낮게 설정)
         # 개선: 현재 점수에서 합리적인 범위 내에서 시작
-        initial_reduction = 0.7 + np.random.uniform(0, 0.15)  # 70-85% 수준에서 시작
-        e_score = current_scores['E'] * initial_reduction
-        s_score = current_scores['S'] * initial_reduction
-        g_score = current_scores['G'] * initial_reduction
-        
-        for i, date in enumerate(dates):
-            progress = i / periods
+        initial_reduction = 0.7 + rng.uniform(0, 0.15)  # 70-85% 수준에서 시작
+        target = np.array([current_scores['E'], current_scores['S'], current_scores['G']], dtype=float)
+        
+        # 기간·영역별 배열 (행: 기간, 열: E/S/G)
+        idx = np.arange(periods)
+        progress = (idx / periods)[:, None]
+        coef = np.array([pattern["e_trend"], pattern["s_trend"], pattern["g_trend"]])
+        decay = np.array([1.0, 0.8, 0.6])
+        trend_type = pattern["trend_type"]
+        
+        # 트렌드 타입별 처리
+        if trend_type == "steady_growth":
+            trend = coef * progress
             
-            # 트렌드 타입별 처리
-            if pattern["trend_type"] == "steady_growth":
-                e_trend = pattern["e_trend"] * progress
-                s_trend = pattern["s_trend"] * progress
-                g_trend = pattern["g_trend"] * progress
-                
-            elif pattern["trend_type"] == "cyclical":
-                cycle = np.sin(2 * np.pi * i / pattern.get("cycle_period", 8))
-                e_trend = pattern["e_trend"] * progress + 0.1 * cycle
-                s_trend = pattern["s_trend"] * progress + 0.08 * cycle
-                g_trend = pattern["g_trend"] * progress + 0.05 * cycle
-                
-            elif pattern["trend_type"] == "rapid_improvement":
-                if i > pattern.get("acceleration_point", 10):
-                    acceleration = (i - pattern["acceleration_point"]) / periods
-                    e_trend = pattern["e_trend"] * progress * (1 + acceleration)
-                    s_trend = pattern["s_trend"] * progress * (1 + acceleration * 0.8)
-                    g_trend = pattern["g_trend"] * progress * (1 + acceleration * 0.6)
-                else:
-                    e_trend = pattern["e_trend"] * progress * 0.3
-                    s_trend = pattern["s_trend"] * progress * 0.3
-                    g_trend = pattern["g_trend"] * progress * 0.3
-                    
-            elif pattern["trend_type"] == "plateau":
-                if i < pattern.get("plateau_start", 12):
-                    e_trend = pattern["e_trend"] * progress * 2
-                    s_trend = pattern["s_trend"] * progress * 2
-                    g_trend = pattern["g_trend"] * progress * 2
-                else:
-                    e_trend = pattern["e_trend"] * 0.5
-                    s_trend = pattern["s_trend"] * 0.5
-                    g_trend = pattern["g_trend"] * 0.5
-                    
-            elif pattern["trend_type"] == "volatile_growth":
-                shock = 0
-                if i % (periods // pattern.get("shock_frequency", 3)) == 0:
-                    shock = np.random.uniform(-0.2, 0.2)
-                e_trend = pattern["e_trend"] * progress + shock
-                s_trend = pattern["s_trend"] * progress + shock * 0.8
-                g_trend = pattern["g_trend"] * progress + shock * 0.6
-                
-            elif pattern["trend_type"] == "s_curve":
-                x = (i - pattern.get("inflection_point", 12)) / 6
-                sigmoid = 1 / (1 + np.exp(-x))
-                e_trend = pattern["e_trend"] * sigmoid
-                s_trend = pattern["s_trend"] * sigmoid
-                g_trend = pattern["g_trend"] * sigmoid
-                
-            elif pattern["trend_type"] == "stepwise":
-                step_value = 0
-                for step_point in pattern.get("step_points", [6, 12, 18]):
-                    if i >= step_point:
-                        step_value += 0.2
-                e_trend = pattern["e_trend"] * step_value
-                s_trend = pattern["s_trend"] * step_value
-                g_trend = pattern["g_trend"] * step_value
+        elif trend_type == "cyclical":
+            cycle = np.sin(2 * np.pi * idx / pattern.get("cycle_period", 8))[:, None]
+            trend = coef * progress + np.array([0.1, 0.08, 0.05]) * cycle
+            
+        elif trend_type == "rapid_improvement":
+            point = pattern.get("acceleration_point", 10)
+            acceleration = ((idx - point) / periods)[:, None]
+            trend = np.where((idx > point)[:, None],
+                             coef * progress * (1 + acceleration * decay),
+                             coef * progress * 0.3)
                 
-            elif pattern["trend_type"] == "declining_then_recovery":
-                if i < pattern.get("recovery_point", 14):
-                    e_trend = pattern["e_trend"] * (1 - progress * 0.5)
-                    s_trend = pattern["s_trend"] * (1 - progress * 0.3)
-                    g_trend = pattern["g_trend"] * (1 - progress * 0.2)
-                else:
-                    recovery_progress = (i - pattern["recovery_point"]) / (periods - pattern["recovery_point"])
-                    e_trend = pattern["e_trend"] + 0.8 * recovery_progress
-                    s_trend = pattern["s_trend"] + 0.6 * recovery_progress
-                    g_trend = pattern["g_trend"] + 0.5 * recovery_progress
-                    
-            elif pattern["trend_type"] == "exponential":
-                growth_rate = pattern.get("growth_rate", 0.1)
-                e_trend = pattern["e_trend"] * (np.exp(growth_rate * progress) - 1)
-                s_trend = pattern["s_trend"] * (np.exp(growth_rate * progress * 0.8) - 1)
-                g_trend = pattern["g_trend"] * (np.exp(growth_rate * progress * 0.6) - 1)
+        elif trend_type == "plateau":
+            trend = np.where((idx < pattern.get("plateau_start", 12))[:, None],
+                             coef * progress * 2,
+                             coef * 0.5)
                 
-            else:  # irregular
-                e_trend = pattern["e_trend"] * progress + np.random.uniform(-0.1, 0.1)
-                s_trend = pattern["s_trend"] * progress + np.random.uniform(-0.08, 0.08)
-                g_trend = pattern["g_trend"] * progress + np.random.uniform(-0.06, 0.06)
-            
-            # 계절성 추가
-            seasonal_e = np.sin(2 * np.pi * i / 4) * pattern["seasonal_strength"]
-            seasonal_s = np.sin(2 * np.pi * i / 4 + np.pi/3) * pattern["seasonal_strength"] * 0.8
-            seasonal_g = np.sin(2 * np.pi * i / 4 + 2*np.pi/3) * pattern["seasonal_strength"] * 0.6
-            
-            # 노이즈 추가
-            noise_e = np.random.normal(0, pattern["volatility"])
-            noise_s = np.random.normal(0, pattern["volatility"] * 0.8)
-            noise_g = np.random.normal(0, pattern["volatility"] * 0.6)
-            
-            # 점수 계산 - 현재 점수를 향해 점진적으로 증가
-            # 목표: 마지막 기간에 현재 점수에 근접하도록
-            target_progress = (i + 1) / periods
+        elif trend_type == "volatile_growth":
+            shock_interval = periods // pattern.get("shock_frequency", 3)
+            if shock_interval == 0:
+                raise ZeroDivisionError("충격 주기가 0입니다 (periods < shock_frequency)")
+            shock_rows = idx % shock_interval == 0
+            shock = np.where(shock_rows, rng.uniform(-0.2, 0.2, periods), 0)[:, None]
+            trend = coef * progress + shock * decay
             
-            # 현재 점수를 향한 수렴
-            e_target = current_scores['E']
-            s_target = current_scores['S']
-            g_target = current_scores['G']
+        elif trend_type == "s_curve":
+            x = (idx - pattern.get("inflection_point", 12)) / 6
+            trend = coef * (1 / (1 + np.exp(-x)))[:, None]
             
-            # 부드러운 수렴을 위한 가중치
-            convergence_weight = target_progress ** 1.5
+        elif trend_type == "stepwise":
+            step_points = np.array(pattern.get("step_points", [6, 12, 18]))
+            step_value = 0.2 * (idx[:, None] >= step_points).sum(axis=1)
+            trend = coef * step_value[:, None]
             
-            # 트렌드, 계절성, 노이즈를 포함한 점수 계산
-            e_score = e_score + (e_target - e_score) * convergence_weight * 0.1 + e_trend + seasonal_e * 2 + noise_e * 3
-            s_score = s_score + (s_target - s_score) * convergence_weight * 0.1 + s_trend + seasonal_s * 2 + noise_s * 3
-            g_score = g_score + (g_target - g_score) * convergence_weight * 0.1 + g_trend + seasonal_g * 2 + noise_g * 3
-            
-            # 충격 포인트 처리
-            if pattern["trend_type"] == "steady_growth" and i in pattern.get("shock_points", []):
-                shock_impact = np.random.uniform(-15, -5)
-                e_score += shock_impact
-                s_score += shock_impact * 0.7
-                g_score += shock_impact * 0.5
+        elif trend_type == "declining_then_recovery":
+            point = pattern.get("recovery_point", 14)
+            recovery_progress = ((idx - point) / (periods - point))[:, None]
+            trend = np.where((idx < point)[:, None],
+                             coef * (1 - progress * np.array([0.5, 0.3, 0.2])),
+                             coef + np.array([0.8, 0.6, 0.5]) * recovery_progress)
+                
+        elif trend_type == "exponential":
+            growth_rate = pattern.get("growth_rate", 0.1)
+            trend = coef * (np.exp(growth_rate * progress * decay) - 1)
             
-            # 회복 속도 적용
+        else:  # irregular
+            trend = coef * progress + rng.uniform(-1, 1, (periods, 3)) * np.array([0.1, 0.08, 0.06])
+        
+        # 계절성 추가
+        phases = np.array([0, np.pi / 3, 2 * np.pi / 3])
+        seasonal = np.sin(2 * np.pi * idx[:, None] / 4 + phases) * pattern["seasonal_strength"] * decay
+        
+        # 노이즈 추가
+        noise = rng.normal(0, pattern["volatility"] * decay, (periods, 3))
+        
+        # 트렌드, 계절성, 노이즈를 포함한 기간별 증분
+        step = trend + seasonal * 2 + noise * 3
+        
+        # 충격 포인트 처리
+        if trend_type == "steady_growth":
+            points = np.asarray(pattern.get("shock_points", []), dtype=int)
+            points = points[(points >= 0) & (points < periods)]
+            # 중복 지점도 발생 횟수만큼 누적
+            np.add.at(step, points, rng.uniform(-15, -5, (len(points), 1)) * np.array([1.0, 0.7, 0.5]))
+        
+        # 부드러운 수렴을 위한 가중치 - 마지막 기간에 현재 점수에 근접하도록
+        convergence_weight = (((idx + 1) / periods) ** 1.5)[:, None] * 0.1
+        # 마지막 몇 개월은 현재 점수에 더 가깝게 조정
+        final_weight = np.where(idx >= periods - 3, 0.7 + 0.1 * (idx - (periods - 3)), 0.0)[:, None]
+        recovery = pattern["recovery_speed"]
+        
+        # 경계값 처리가 있는 수렴 점화식만 기간 순서대로 계산
+        scores = np.empty((periods, 3))
+        prev = target * initial_reduction
+        for i in range(periods):
+            score = prev + (target - prev) * convergence_weight[i] + step[i]
             if i > 0:
-                recovery = pattern["recovery_speed"]
-                e_score = e_score * recovery + data[-1]['E'] * (1 - recovery)
-                s_score = s_score * recovery + data[-1]['S'] * (1 - recovery)
-                g_score = g_score * recovery + data[-1]['G'] * (1 - recovery)
-            
-            # 경계값 처리
-            e_score = max(0, min(100, e_score))
-            s_score = max(0, min(100, s_score))
-            g_score = max(0, min(100, g_score))
-            
-            # 마지막 몇 개월은 현재 점수에 더 가깝게 조정
-            if i >= periods - 3:
-                final_weight = 0.7 + 0.1 * (i - (periods - 3))
-                e_score = e_score * (1 - final_weight) + current_scores['E'] * final_weight
-                s_score = s_score * (1 - final_weight) + current_scores['S'] * final_weight
-                g_score = g_score * (1 - final_weight) + current_scores['G'] * final_weight
-            
-            data.append({
-                'date': date,
-                'E': e_score,
-                'S': s_score,
-                'G': g_score,
-                'total': (e_score * 0.35 + s_score * 0.35 + g_score * 0.3)
-            })
-        
-        return pd.DataFrame(data)
+                # 회복 속도 적용
+                score = score * recovery + prev * (1 - recovery)
+            score = np.clip(score, 0, 100)
+            scores[i] = prev = score * (1 - final_weight[i]) + target * final_weight[i]
+        
+        return pd.DataFrame({
+            'date': dates,
+            'E': scores[:, 0],
+            'S': scores[:, 1],
+            'G': scores[:, 2],
+            'total': scores @ np.array([0.35, 0.35, 0.3])
+        })
     
     def train_prediction_model(self, historical_data: pd.DataFrame) -> Dict:
         """예측 모델 학습
@@ -321,6 +280,10 @@ class AIPredictor:
         Returns:
             학습된 모델 정보
         """
+        # scikit-learn은 첫 학습 시점에 로드 (앱 기동 시간 단축)
+        from sklearn.ensemble import RandomForestRegressor
+        from sklearn.preprocessing import StandardScaler
+        
         # 특성 엔지니어링
         df = historical_data.copy()
         df['month'] = df['date'].dt.month
@@ -386,7 +349,6 @@ class AIPredictor:
         Returns:
             예측 결과 데이터프레임
         """
-        predictions = []
         last_date = historical_data['date'].max()
         
         # 기업별 예측 특성 정의 - 현재 성과 수준에 맞춰 조정
@@ -411,22 +373,33 @@ class AIPredictor:
                       [f'{x}_ma6' for x in ['E', 'S', 'G']] + \
                       [f'{x}_change' for x in ['E', 'S', 'G']]
         
-        # 확장된 데이터프레임 생성
-        extended_df = historical_data.copy()
+        # 영역별 점수 이력 (예측값을 뒤에 이어 붙임, 매 단계 DataFrame 재생성 없음)
+        history = {col: historical_data[col].tolist() for col in ['E', 'S', 'G']}
         
-        for i in range(1, periods + 1):
-            pred_date = last_date + timedelta(days=30 * i)
-            
+        # 단계와 무관한 값은 루프 밖에서 한 번에 계산
+        steps = np.arange(1, periods + 1)
+        pred_dates = [last_date + timedelta(days=30 * int(i)) for i in steps]
+        months = np.array([d.month for d in pred_dates])
+        quarters = (months - 1) // 3 + 1
+        # 초기에는 현재값에 더 가중치를 두고, 점진적으로 모델 예측에 가중치 증가 (최대 70%)
+        model_weights = np.minimum(0.7, steps / periods)
+        rng = self._rng(company_name, FORECAST_STREAM)
+        volatility_effects = rng.normal(0, traits['volatility'] * 5, (periods, 3))
+        
+        # 예측 결과 (행: 기간, 열: E/S/G/total)
+        predictions = np.empty((periods, 4))
+        
+        for i in steps:
             # 특성 생성
             features = {
-                'month': pred_date.month,
-                'quarter': (pred_date.month - 1) // 3 + 1,
-                'trend': len(extended_df) + i
+                'month': months[i - 1],
+                'quarter': quarters[i - 1],
+                'trend': len(history['E']) + i
             }
             
             # 이동 평균 계산
             for col in ['E', 'S', 'G']:
-                recent_values = extended_df[col].tail(6).values
+                recent_values = np.array(history[col][-6:])
                 features[f'{col}_ma3'] = np.mean(recent_values[-3:]) if len(recent_values) >= 3 else recent_values[-1]
                 features[f'{col}_ma6'] = np.mean(recent_values) if len(recent_values) >= 6 else np.mean(recent_values)
                 
@@ -436,34 +409,34 @@ class AIPredictor:
                 else:
                     features[f'{col}_change'] = 0
             
+            # 학습 시와 동일한 순서로 특성 생성 (영역 공통)
+            X_pred = pd.DataFrame([features], columns=feature_cols)
+            
             # 예측
             pred_scores = {}
-            for target in ['E', 'S', 'G']:
+            for j, target in enumerate(['E', 'S', 'G']):
                 if target in self.models:
-                    # 학습 시와 동일한 순서로 특성 생성
-                    X_pred = pd.DataFrame([features])[feature_cols]
                     X_scaled = self.scalers[target].transform(X_pred)
                     base_pred = self.models[target].predict(X_scaled)[0]
                     
                     # 기업별 특성 적용
-                    last_value = extended_df[target].iloc[-1]
+                    last_value = history[target][-1]
                     
                     # 모멘텀 효과 (이전 추세 반영)
-                    if len(extended_df) >= 3:
-                        recent_trend = extended_df[target].tail(3).diff().mean()
+                    if len(history[target]) >= 3:
+                        recent_trend = np.diff(history[target][-3:]).mean()
                         momentum_effect = recent_trend * traits['momentum']
                     else:
                         momentum_effect = 0
                     
                     # 변동성 추가
-                    volatility_effect = np.random.normal(0, traits['volatility'] * 5)
+                    volatility_effect = volatility_effects[i - 1, j]
                     
                     # 개선 한계 적용 (너무 급격한 개선 방지)
                     max_improvement = last_value * (1 + traits['improvement_cap'] / 12)
                     
                     # 최종 예측값 계산 - 모델 예측과 현재값의 가중 평균
-                    # 초기에는 현재값에 더 가중치를 두고, 점진적으로 모델 예측에 가중치 증가
-                    model_weight = min(0.7, i / periods)  # 최대 70%까지만 모델에 의존
+                    model_weight = model_weights[i - 1]
                     current_weight = 1 - model_weight
                     
                     final_pred = (base_pred * model_weight + last_value * current_weight) + momentum_effect + volatility_effect
@@ -482,7 +455,7 @@ class AIPredictor:
                     
                     pred_scores[target] = max(0, min(100, final_pred))
                 else:
-                    pred_scores[target] = extended_df[target].iloc[-1]
+                    pred_scores[target] = history[target][-1]
             
             # 총점 계산
             pred_scores['total'] = (
@@ -491,16 +464,20 @@ class AIPredictor:
                 pred_scores['G'] * 0.3
             )
             
-            pred_scores['date'] = pred_date
-            predictions.append(pred_scores)
+            predictions[i - 1] = [pred_scores['E'], pred_scores['S'], pred_scores['G'], pred_scores['total']]
             
             # 예측값을 다음 예측의 입력으로 사용
-            extended_df = pd.concat([
-                extended_df,
-                pd.DataFrame([pred_scores])
-            ], ignore_index=True)
-        
-        return pd.DataFrame(predictions)
+            for col in ['E', 'S', 'G']:
+                history[col].append(pred_scores[col])
+        
+        # 결과 데이터프레임은 열 단위로 한 번만 생성
+        return pd.DataFrame({
+            'E': predictions[:, 0],
+            'S': predictions[:, 1],
+            'G': predictions[:, 2],
+            'total': predictions[:, 3],
+            'date': pred_dates
+        })
     
     def analyze_improvement_drivers(self, current_scores: Dict, target_grade: str) -> Dict:
         """개선 동인 분석
@@ -531,8 +508,6 @@ class AIPredictor:
         
         # 각 영역별 개선 기회 분석
         recommendations = []
-        total_cost = 0
-        total_time = 0
         expected_improvement = 0
         
         # 영역별 가중치
@@ -555,10 +530,11 @@ class AIPredictor:
                             'time': details['time'],
                             'priority': 'high' if current_area_score < 70 else 'medium'
                         })
-                        total_cost += details['cost']
-                        total_time = max(total_time, details['time'])
                         expected_improvement += impact
         
+        total_cost = sum(rec['cost'] for rec in recommendations)
+        total_time = max((rec['time'] for rec in recommendations), default=0)
+        
         # 우선순위 정렬
         recommendations.sort(key=lambda x: x['impact'] / x['cost'], reverse=True)
         
@@ -633,40 +609,48 @@ class AIPredictor:
         Returns:
             시나리오 분석 결과
         """
-        results = []
+        # 시나리오 × 영역(E/S/G) 개선폭 행렬
+        impacts = np.zeros((len(scenarios), 3))
+        for i, scenario in enumerate(scenarios):
+            for improvement in scenario.get('improvements', []):
+                impacts[i, AREA_INDEX[improvement['area']]] += improvement['impact']
         
-        for scenario in scenarios:
-            # 시나리오별 점수 변화 계산
-            new_scores = current_scores.copy()
-            
-            if 'improvements' in scenario:
-                for improvement in scenario['improvements']:
-                    area = improvement['area']
-                    impact = improvement['impact']
-                    new_scores[area] = min(100, new_scores[area] + impact)
-            
-            # 새로운 총점 계산
-            new_scores['total'] = (
-                new_scores['E'] * 0.35 +
-                new_scores['S'] * 0.35 +
-                new_scores['G'] * 0.3
-            )
-            
-            # 금융적 영향 계산
-            financial_impact = self.calculate_financial_impact(new_scores['total'])
-            
-            results.append({
-                'scenario': scenario['name'],
-                'new_score': new_scores['total'],
-                'score_change': new_scores['total'] - current_scores['total'],
-                'new_grade': self._score_to_grade(new_scores['total']),
-                'rate_discount': financial_impact['rate_discount'],
-                'annual_savings': financial_impact['annual_savings'],
-                'investment': scenario.get('investment', 0),
-                'roi': financial_impact['roi_5y']
-            })
-        
-        return pd.DataFrame(results)
+        names = [scenario['name'] for scenario in scenarios]
+        investments = np.array([scenario.get('investment', 0) for scenario in scenarios])
+        
+        return self.generate_scenario_analysis_vec(current_scores, impacts, investments, names)
+    
+    def generate_scenario_analysis_vec(self, current_scores: Dict, impacts: np.ndarray,
+                                       investments: np.ndarray, names: List[str]) -> pd.DataFrame:
+        """시나리오별 영향 분석 (배열 입력)
+        
+        Args:
+            current_scores: 현재 ESG 점수
+            impacts: 시나리오 × 영역(E/S/G) 개선폭 행렬
+            investments: 시나리오별 투자금액
+            names: 시나리오 이름
+        
+        Returns:
+            시나리오 분석 결과
+        """
+        # 새로운 영역 점수 및 총점 일괄 계산
+        base_scores = np.array([current_scores['E'], current_scores['S'], current_scores['G']])
+        new_area_scores = np.minimum(100, base_scores + np.asarray(impacts))
+        new_totals = new_area_scores @ np.array([0.35, 0.35, 0.3])
+        
+        # 금융적 영향 계산 (등급 구간별 조회)
+        impacts_by_score = [self.calculate_financial_impact(total) for total in new_totals.tolist()]
+        
+        return pd.DataFrame({
+            'scenario': list(names),
+            'new_score': new_totals,
+            'score_change': new_totals - current_scores['total'],
+            'new_grade': [self._score_to_grade(total) for total in new_totals.tolist()],
+            'rate_discount': [impact['rate_discount'] for impact in impacts_by_score],
+            'annual_savings': [impact['annual_savings'] for impact in impacts_by_score],
+            'investment': np.asarray(investments),
+            'roi': [impact['roi_5y'] for impact in impacts_by_score]
+        })
     
     def _score_to_grade(self, score: float) -> str:
         """점수를 등급으로 변환"""
@@ -694,26 +678,25 @@ class AIPredictor:
         Returns:
             신뢰도 정보
         """
-        # 예측 변동성 계산
-        volatility = {
-            'E': predictions['E'].std(),
-            'S': predictions['S'].std(),
-            'G': predictions['G'].std(),
-            'total': predictions['total'].std()
-        }
+        # 영역별 평균/표준편차 일괄 계산
+        cols = ['E', 'S', 'G', 'total']
+        values = predictions[cols].to_numpy(dtype=np.float64)
+        means = values.mean(axis=0)
+        stds = values.std(axis=0, ddof=1)
+        
+        # 예측 변동성
+        volatility = dict(zip(cols, stds.tolist()))
         
         # 신뢰 구간 계산 (95%)
-        confidence_intervals = {}
-        for col in ['E', 'S', 'G', 'total']:
-            mean = predictions[col].mean()
-            std = predictions[col].std()
-            confidence_intervals[col] = {
-                'lower': mean - 1.96 * std,
-                'upper': mean + 1.96 * std
-            }
+        lowers = (means - 1.96 * stds).tolist()
+        uppers = (means + 1.96 * stds).tolist()
+        confidence_intervals = {
+            col: {'lower': lower, 'upper': upper}
+            for col, lower, upper in zip(cols, lowers, uppers)
+        }
         
         # 전체 신뢰도 점수 (0-100)
-        avg_volatility = np.mean(list(volatility.values()))
+        avg_volatility = float(stds.mean())
         confidence_score = max(0, min(100, 100 - avg_volatility * 2))
         
         return {
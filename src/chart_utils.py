@@ -0,0 +1,40 @@
+"""
+차트 데이터 유틸리티
+트레이스 전송 포인트 수 제한을 위한 다운샘플링
+"""
+import numpy as np
+
+# 트레이스당 전송 최대 포인트 수 (초과 시 LTTB 다운샘플링)
+MAX_TRACE_POINTS = 500
+
+def lttb_indices(values: np.ndarray, max_points: int = MAX_TRACE_POINTS) -> np.ndarray:
+    """LTTB(Largest-Triangle-Three-Buckets) 다운샘플링 인덱스 (등간격 x 기준)"""
+    n = len(values)
+    if n <= max_points or max_points < 3:
+        return np.arange(n)
+    
+    # 첫/마지막 점을 제외한 구간을 (max_points - 2)개 버킷으로 분할
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    positions = np.arange(n, dtype=np.float64)
+    selected = [0]
+    
+    for b in range(max_points - 2):
+        start, end = edges[b], edges[b + 1]
+        
+        # 다음 버킷 평균점 (마지막 버킷은 마지막 점)
+        if b + 2 < len(edges):
+            next_x = positions[end:edges[b + 2]].mean()
+            next_y = values[end:edges[b + 2]].mean()
+        else:
+            next_x, next_y = positions[-1], values[-1]
+        
+        # 직전 선택점·다음 평균점과 이루는 삼각형 면적이 최대인 점 선택
+        prev = selected[-1]
+        areas = np.abs(
+            (positions[prev] - next_x) * (values[start:end] - values[prev])
+            - (positions[prev] - positions[start:end]) * (next_y - values[prev])
+        )
+        selected.append(start + int(areas.argmax()))
+    
+    selected.append(n - 1)
+    return np.asarray(selected)
@@ -2,16 +2,44 @@
 프레젠테이션 모드 및 PDF 리포트 생성 모듈
 경영진 브리핑 및 공식 문서 생성
 """
+from __future__ import annotations
+
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime
 from typing import Dict, List, Optional
 import base64
 from io import BytesIO
 import json
 
+from src.ui_helpers import COMPLIANCE_CARD_TEMPLATE, bullet_markdown
+
+# 규제 준수 기준
+COMPLIANCE_STANDARDS = ('K-Taxonomy', 'TCFD', 'GRI')
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_score_bar(e_score: float, s_score: float, g_score: float, total_score: float) -> go.Figure:
+    """영역별 점수 막대 차트 생성 (점수 기준 캐시)"""
+    import plotly.graph_objects as go
+    values = [e_score, s_score, g_score, total_score]
+    return go.Figure(
+        data=[
+            go.Bar(
+                x=['환경(E)', '사회(S)', '거버넌스(G)', '종합'],
+                y=values,
+                marker_color=['#00D67A', '#0046FF', '#FFB800', '#FF4757'],
+                text=[f"{v:.1f}" for v in values],
+                textposition='outside'
+            )
+        ],
+        layout=dict(
+            height=400,
+            yaxis_range=[0, 110],
+            showlegend=False,
+            margin=dict(l=30, r=10, t=40, b=30)
+        )
+    )
+
 class PresentationMode:
     """프레젠테이션 모드 관리"""
     
@@ -100,7 +128,7 @@ class PresentationMode:
                 'type': 'ai_forecast',
                 'title': 'AI 기반 미래 전망',
                 'prediction_period': '1년',
-                'predicted_score': ai_predictions['predictions'].iloc[-1]['total'] if 'predictions' in ai_predictions else 85,
+                'predicted_score': ai_predictions['predictions']['total'].iat[-1] if 'predictions' in ai_predictions else 85,
                 'confidence': ai_predictions.get('confidence', {}).get('confidence_score', 85),
                 'improvement_potential': ai_predictions.get('improvement_analysis', {}).get('gap', 10),
                 'key_drivers': [
@@ -266,13 +294,11 @@ class PresentationMode:
             """)
             
             st.markdown("### 주요 성과")
-            for achievement in content['key_achievements']:
-                st.write(f"✅ {achievement}")
+            st.markdown(bullet_markdown(content['key_achievements'], "✅"))
         
         with col2:
             st.markdown("### 개선 필요 영역")
-            for issue in content['critical_issues']:
-                st.write(f"⚠️ {issue}")
+            st.markdown(bullet_markdown(content['critical_issues'], "⚠️"))
     
     def _render_performance_overview(self, slide: Dict):
         """성과 Overview 슬라이드"""
@@ -281,37 +307,29 @@ class PresentationMode:
         scores = slide['scores']
         
         # 점수 차트
-        fig = go.Figure(data=[
-            go.Bar(
-                x=['환경(E)', '사회(S)', '거버넌스(G)', '종합'],
-                y=[scores['E'], scores['S'], scores['G'], scores['Total']],
-                marker_color=['#00D67A', '#0046FF', '#FFB800', '#FF4757'],
-                text=[f"{v:.1f}" for v in scores.values()],
-                textposition='outside'
-            )
-        ])
-        
-        fig.update_layout(
-            height=400,
-            yaxis_range=[0, 110],
-            showlegend=False
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        fig = build_score_bar(scores['E'], scores['S'], scores['G'], scores['Total'])
+
+        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
         
         # 규제 준수
         st.markdown("### 규제 준수 현황")
         compliance = slide['compliance']
         
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("K-Taxonomy", compliance['K-Taxonomy']['status'])
-        with col2:
-            st.metric("TCFD", compliance['TCFD']['status'])
-        with col3:
-            st.metric("GRI", compliance['GRI']['status'])
-        with col4:
-            st.metric("준수도", f"{compliance['overall']:.0f}%")
+        cards = "".join(
+            COMPLIANCE_CARD_TEMPLATE.format(
+                color="#00D67A" if compliance[name]['status'] == "준수" else "#FF4757",
+                name=name,
+                status=compliance[name]['status']
+            )
+            for name in COMPLIANCE_STANDARDS
+        )
+        cards += COMPLIANCE_CARD_TEMPLATE.format(
+            color="#0046FF", name="준수도", status=f"{compliance['overall']:.0f}%"
+        )
+        st.markdown(
+            f'<div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;">{cards}</div>',
+            unsafe_allow_html=True
+        )
     
     def _render_financial_impact(self, slide: Dict):
         """재무 영향 슬라이드"""
@@ -349,16 +367,17 @@ class PresentationMode:
         
         with col2:
             st.markdown("### 주요 개선 동인")
-            for driver in slide['key_drivers']:
-                st.write(f"• {driver}")
+            st.markdown(bullet_markdown(slide['key_drivers']))
     
     def _render_financial_solutions(self, slide: Dict):
         """금융 솔루션 슬라이드"""
         st.markdown(f"## {slide['title']}")
         
         st.markdown("### 추천 상품")
-        for product in slide['recommended_products']:
-            st.info(f"• {product.get('product', 'ESG 대출')} - 금리 {product.get('rate_discount', 1.0)}%p 우대")
+        st.info(bullet_markdown(
+            f"{product.get('product', 'ESG 대출')} - 금리 {product.get('rate_discount', 1.0)}%p 우대"
+            for product in slide['recommended_products']
+        ))
         
         st.markdown("### 패키지 혜택")
         benefits = slide['package_benefits']
@@ -384,8 +403,7 @@ class PresentationMode:
             st.metric("고위험 업체", f"{metrics['high_risk_suppliers']}개")
         
         st.markdown("### 주요 Action Items")
-        for item in slide['action_items']:
-            st.write(f"• {item}")
+        st.markdown(bullet_markdown(slide['action_items']))
     
     def _render_roadmap(self, slide: Dict):
         """로드맵 슬라이드"""
@@ -396,8 +414,7 @@ class PresentationMode:
                 st.write(f"**기간**: {phase['timeline']}")
                 st.write(f"**투자**: {phase['investment']}")
                 st.write("**주요 활동**:")
-                for action in phase['actions']:
-                    st.write(f"• {action}")
+                st.markdown(bullet_markdown(phase['actions']))
     
     def _render_next_steps(self, slide: Dict):
         """Next Steps 슬라이드"""
@@ -407,18 +424,15 @@ class PresentationMode:
         
         with col1:
             st.markdown("### 즉시 실행")
-            for action in slide['immediate_actions']:
-                st.write(f"• {action}")
+            st.markdown(bullet_markdown(slide['immediate_actions']))
         
         with col2:
             st.markdown("### 2분기 목표")
-            for milestone in slide['q2_milestones']:
-                st.write(f"• {milestone}")
+            st.markdown(bullet_markdown(slide['q2_milestones']))
         
         with col3:
             st.markdown("### 연말 목표")
-            for target in slide['year_end_targets']:
-                st.write(f"• {target}")
+            st.markdown(bullet_markdown(slide['year_end_targets']))
     
     def _render_closing_slide(self, slide: Dict):
         """맺음말 슬라이드"""
@@ -469,7 +483,11 @@ class ReportGenerator:
         Returns:
             HTML 문자열
         """
-        html = f"""
+        scores = evaluation_data['scores']
+        benefits = evaluation_data['financial_benefits']
+        compliance = evaluation_data['compliance']
+        
+        parts = [f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -589,18 +607,18 @@ class ReportGenerator:
             </style>
         </head>
         <body>
-        """
+        """]
         
         # 헤더
-        html += f"""
+        parts.append(f"""
         <div class="header">
             <h1>ESG 종합 평가 리포트</h1>
             <p>{company_name} | {datetime.now().strftime('%Y년 %m월 %d일')}</p>
         </div>
-        """
+        """)
         
         # Executive Summary
-        html += f"""
+        parts.append(f"""
         <div class="section">
             <h2>Executive Summary</h2>
             <div class="metrics">
@@ -611,23 +629,23 @@ class ReportGenerator:
                     <div class="label">ESG 등급</div>
                 </div>
                 <div class="metric">
-                    <div class="value">{evaluation_data['scores']['total']:.1f}</div>
+                    <div class="value">{scores['total']:.1f}</div>
                     <div class="label">종합 점수</div>
                 </div>
                 <div class="metric">
-                    <div class="value">{evaluation_data['financial_benefits']['discount_rate']}%p</div>
+                    <div class="value">{benefits['discount_rate']}%p</div>
                     <div class="label">금리 우대</div>
                 </div>
                 <div class="metric">
-                    <div class="value">{evaluation_data['financial_benefits']['annual_savings']:.0f}억</div>
+                    <div class="value">{benefits['annual_savings']:.0f}억</div>
                     <div class="label">연간 절감</div>
                 </div>
             </div>
         </div>
-        """
+        """)
         
         # ESG 상세 점수
-        html += f"""
+        parts.append(f"""
         <div class="section">
             <h2>1. ESG 평가 결과</h2>
             <table>
@@ -639,34 +657,40 @@ class ReportGenerator:
                 </tr>
                 <tr>
                     <td>환경 (E)</td>
-                    <td>{evaluation_data['scores']['E']:.1f}</td>
-                    <td>{self._score_to_grade(evaluation_data['scores']['E'])}</td>
-                    <td>{'우수' if evaluation_data['scores']['E'] >= 80 else '보통' if evaluation_data['scores']['E'] >= 60 else '개선필요'}</td>
+                    <td>{scores['E']:.1f}</td>
+                    <td>{self._score_to_grade(scores['E'])}</td>
+                    <td>{'우수' if scores['E'] >= 80 else '보통' if scores['E'] >= 60 else '개선필요'}</td>
                 </tr>
                 <tr>
                     <td>사회 (S)</td>
-                    <td>{evaluation_data['scores']['S']:.1f}</td>
-                    <td>{self._score_to_grade(evaluation_data['scores']['S'])}</td>
-                    <td>{'우수' if evaluation_data['scores']['S'] >= 80 else '보통' if evaluation_data['scores']['S'] >= 60 else '개선필요'}</td>
+                    <td>{scores['S']:.1f}</td>
+                    <td>{self._score_to_grade(scores['S'])}</td>
+                    <td>{'우수' if scores['S'] >= 80 else '보통' if scores['S'] >= 60 else '개선필요'}</td>
                 </tr>
                 <tr>
                     <td>거버넌스 (G)</td>
-                    <td>{evaluation_data['scores']['G']:.1f}</td>
-                    <td>{self._score_to_grade(evaluation_data['scores']['G'])}</td>
-                    <td>{'우수' if evaluation_data['scores']['G'] >= 80 else '보통' if evaluation_data['scores']['G'] >= 60 else '개선필요'}</td>
+                    <td>{scores['G']:.1f}</td>
+                    <td>{self._score_to_grade(scores['G'])}</td>
+                    <td>{'우수' if scores['G'] >= 80 else '보통' if scores['G'] >= 60 else '개선필요'}</td>
                 </tr>
                 <tr style="font-weight: bold;">
                     <td>종합</td>
-                    <td>{evaluation_data['scores']['total']:.1f}</td>
+                    <td>{scores['total']:.1f}</td>
                     <td>{evaluation_data['grade']}</td>
-                    <td>{'우수' if evaluation_data['scores']['total'] >= 80 else '보통' if evaluation_data['scores']['total'] >= 60 else '개선필요'}</td>
+                    <td>{'우수' if scores['total'] >= 80 else '보통' if scores['total'] >= 60 else '개선필요'}</td>
                 </tr>
             </table>
         </div>
-        """
+        """)
         
         # 규제 준수 현황
-        html += f"""
+        compliance_rows = "".join(
+            f"<tr><td>{name}</td><td>{'✅' if compliance[name]['compliant'] else '❌'}</td>"
+            f"<td>{compliance[name]['status']}</td></tr>"
+            for name in COMPLIANCE_STANDARDS
+        )
+        
+        parts.append(f"""
         <div class="section">
             <h2>2. 규제 준수 현황</h2>
             <table>
@@ -675,81 +699,66 @@ class ReportGenerator:
                     <th>준수 여부</th>
                     <th>상태</th>
                 </tr>
-                <tr>
-                    <td>K-Taxonomy</td>
-                    <td>{'✅' if evaluation_data['compliance']['K-Taxonomy']['compliant'] else '❌'}</td>
-                    <td>{evaluation_data['compliance']['K-Taxonomy']['status']}</td>
-                </tr>
-                <tr>
-                    <td>TCFD</td>
-                    <td>{'✅' if evaluation_data['compliance']['TCFD']['compliant'] else '❌'}</td>
-                    <td>{evaluation_data['compliance']['TCFD']['status']}</td>
-                </tr>
-                <tr>
-                    <td>GRI</td>
-                    <td>{'✅' if evaluation_data['compliance']['GRI']['compliant'] else '❌'}</td>
-                    <td>{evaluation_data['compliance']['GRI']['status']}</td>
-                </tr>
+                {compliance_rows}
             </table>
-            <p><strong>종합 준수도: {evaluation_data['compliance']['overall']:.0f}%</strong></p>
+            <p><strong>종합 준수도: {compliance['overall']:.0f}%</strong></p>
         </div>
-        """
+        """)
         
         # 금융 혜택
-        html += f"""
+        parts.append(f"""
         <div class="page-break"></div>
         <div class="section">
             <h2>3. 금융 혜택 분석</h2>
             <h3>현재 혜택</h3>
             <ul>
-                <li>기준 금리: {evaluation_data['financial_benefits']['base_rate']}%</li>
-                <li>ESG 우대 할인: -{evaluation_data['financial_benefits']['discount_rate']}%p</li>
-                <li>최종 적용 금리: <strong>{evaluation_data['financial_benefits']['final_rate']}%</strong></li>
-                <li>대출 금액: {evaluation_data['financial_benefits']['loan_amount']:,}억원</li>
-                <li>연간 이자 절감액: <strong>{evaluation_data['financial_benefits']['annual_savings']:.0f}억원</strong></li>
+                <li>기준 금리: {benefits['base_rate']}%</li>
+                <li>ESG 우대 할인: -{benefits['discount_rate']}%p</li>
+                <li>최종 적용 금리: <strong>{benefits['final_rate']}%</strong></li>
+                <li>대출 금액: {benefits['loan_amount']:,}억원</li>
+                <li>연간 이자 절감액: <strong>{benefits['annual_savings']:.0f}억원</strong></li>
             </ul>
             
             <h3>5년 전망</h3>
             <ul>
-                <li>누적 절감액: {evaluation_data['financial_benefits']['annual_savings'] * 5:.0f}억원</li>
+                <li>누적 절감액: {benefits['annual_savings'] * 5:.0f}억원</li>
                 <li>추가 조달 가능 금액: 2,000억원</li>
-                <li>총 경제적 가치: {evaluation_data['financial_benefits']['annual_savings'] * 5 + 100:.0f}억원</li>
+                <li>총 경제적 가치: {benefits['annual_savings'] * 5 + 100:.0f}억원</li>
             </ul>
         </div>
-        """
+        """)
         
         # AI 예측 (조건부)
         if ai_predictions:
-            html += f"""
+            parts.append(f"""
             <div class="section">
                 <h2>4. AI 기반 미래 전망</h2>
                 <ul>
                     <li>예측 신뢰도: {ai_predictions.get('confidence', {}).get('confidence_score', 85):.0f}%</li>
-                    <li>1년 후 예상 점수: {ai_predictions.get('predictions', pd.DataFrame()).iloc[-1]['total'] if 'predictions' in ai_predictions else 85:.1f}점</li>
+                    <li>1년 후 예상 점수: {ai_predictions['predictions']['total'].iat[-1] if 'predictions' in ai_predictions else 85:.1f}점</li>
                     <li>개선 잠재력: +{ai_predictions.get('improvement_analysis', {}).get('gap', 10):.1f}점</li>
                     <li>필요 투자: {ai_predictions.get('improvement_analysis', {}).get('total_cost', 500)}억원</li>
                     <li>예상 ROI: {ai_predictions.get('improvement_analysis', {}).get('roi', 150):.0f}%</li>
                 </ul>
             </div>
-            """
+            """)
         
         # 개선 권고사항
-        html += f"""
+        parts.append(f"""
         <div class="section">
             <h2>5. 개선 권고사항</h2>
             <ol>
-        """
+        """)
         
-        for area in evaluation_data.get('improvement_areas', []):
-            html += f"<li>{area}</li>"
+        parts.append("".join(f"<li>{area}</li>" for area in evaluation_data.get('improvement_areas', [])))
         
-        html += """
+        parts.append("""
             </ol>
         </div>
-        """
+        """)
         
         # 푸터
-        html += f"""
+        parts.append(f"""
         <div class="footer">
             <p>본 리포트는 신한은행 ESG 평가 시스템에 의해 자동 생성되었습니다.</p>
             <p>문의: ESG금융본부 | 02-6360-3000 | esg@shinhan.com</p>
@@ -757,9 +766,9 @@ class ReportGenerator:
         </div>
         </body>
         </html>
-        """
+        """)
         
-        return html
+        return "".join(parts)
     
     def _score_to_grade(self, score: float) -> str:
         """점수를 등급으로 변환"""
@@ -8,6 +8,11 @@ from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 import json
 import random
+import zlib
+
+# 난수 스트림 구분 (배출량 활동량과 공급업체 목록은 독립 스트림 사용)
+SCOPE3_STREAM = 0
+SUPPLIER_STREAM = 1
 
 class SupplyChainAnalyzer:
     """공급망 ESG 분석 엔진"""
@@ -78,6 +83,29 @@ class SupplyChainAnalyzer:
             }
         }
         
+        # Scope 3 계산용 배열 (카테고리 순서 고정)
+        self._scope3_ids = list(self.scope3_categories)
+        self._scope3_factors = np.array(
+            [category['avg_emission_factor'] for category in self.scope3_categories.values()]
+        )
+        self._scope3_industry_adjustments = {
+            "제조업": np.array([1.5 if category_id in ("purchased_goods", "transportation_upstream") else 1.0
+                               for category_id in self._scope3_ids]),
+            "금융업": np.array([2.0 if category_id == "investments" else 1.0
+                               for category_id in self._scope3_ids])
+        }
+        
+        # 지역별 리스크 조정 계수
+        self.location_risk = {
+            'Korea': 1.0,
+            'Japan': 1.0,
+            'USA': 1.1,
+            'EU': 1.0,
+            'China': 1.3,
+            'Vietnam': 1.4,
+            'India': 1.5
+        }
+        
         # 공급업체 리스크 평가 기준
         self.risk_criteria = {
             "environmental": {
@@ -122,6 +150,13 @@ class SupplyChainAnalyzer:
             }
         }
     
+    @staticmethod
+    def _rng(company_data: dict, stream: int) -> np.random.Generator:
+        """기업·스트림별 독립 난수 생성기 (전역 난수 상태를 쓰지 않아 병렬 실행에도 재현 가능)"""
+        name = company_data.get('basic_info', {}).get('name')
+        seed = zlib.crc32(name.encode('utf-8')) if name else 42
+        return np.random.default_rng([seed, stream])
+    
     def calculate_scope3_emissions(self, company_data: dict, 
                                   supply_chain_data: Optional[dict] = None) -> dict:
         """Scope 3 배출량 계산
@@ -138,55 +173,43 @@ class SupplyChainAnalyzer:
         
         # 공급망 데이터가 없으면 시뮬레이션
         if not supply_chain_data:
-            supply_chain_data = self._simulate_supply_chain(industry, revenue)
-        
-        # 카테고리별 배출량 계산
-        emissions_by_category = {}
-        total_emissions = 0
+            supply_chain_data = self._simulate_supply_chain(industry, revenue, self._rng(company_data, SCOPE3_STREAM))
         
-        for category_id, category in self.scope3_categories.items():
-            # 활동량 추정
-            activity_amount = supply_chain_data.get(category_id, {}).get('amount', revenue * 0.1)
-            
-            # 배출계수 적용
-            emission_factor = category['avg_emission_factor']
-            
-            # 산업별 조정
-            if industry == "제조업" and category_id in ["purchased_goods", "transportation_upstream"]:
-                emission_factor *= 1.5
-            elif industry == "금융업" and category_id == "investments":
-                emission_factor *= 2.0
-            
-            # 배출량 계산
-            emissions = activity_amount * emission_factor
-            
-            emissions_by_category[category_id] = {
-                'name': category['name'],
-                'emissions': round(emissions, 2),
-                'percentage': 0,  # 나중에 계산
+        # 카테고리별 배출량 계산 (활동량 × 배출계수 × 산업별 조정을 배열 연산으로)
+        activity_amounts = [
+            supply_chain_data.get(category_id, {}).get('amount', revenue * 0.1)
+            for category_id in self._scope3_ids
+        ]
+        factors = self._scope3_factors * self._scope3_industry_adjustments.get(industry, 1.0)
+        emissions = np.asarray(activity_amounts, dtype=np.float64) * factors
+        total_emissions = float(emissions.sum())
+        
+        rounded_emissions = [round(e, 2) for e in emissions.tolist()]
+        emissions_by_category = {
+            category_id: {
+                'name': self.scope3_categories[category_id]['name'],
+                'emissions': rounded,
+                # 비율 계산
+                'percentage': round(rounded / total_emissions * 100, 1) if total_emissions > 0 else 0,
                 'activity_amount': activity_amount,
-                'emission_factor': emission_factor
+                'emission_factor': factor
             }
-            
-            total_emissions += emissions
-        
-        # 비율 계산
-        for category in emissions_by_category.values():
-            category['percentage'] = round(category['emissions'] / total_emissions * 100, 1) if total_emissions > 0 else 0
-        
-        # 주요 배출원 식별
-        sorted_categories = sorted(emissions_by_category.items(), 
-                                 key=lambda x: x[1]['emissions'], 
-                                 reverse=True)
+            for category_id, rounded, activity_amount, factor in zip(
+                self._scope3_ids, rounded_emissions, activity_amounts, factors.tolist()
+            )
+        }
         
+        # 주요 배출원 식별 (배출량 내림차순 상위 5개)
+        top_indices = np.argsort(-np.asarray(rounded_emissions), kind='stable')[:5]
+        top_categories = [self._scope3_ids[i] for i in top_indices.tolist()]
         hotspots = [
             {
-                'category': cat[1]['name'],
-                'emissions': cat[1]['emissions'],
-                'percentage': cat[1]['percentage'],
-                'reduction_potential': self._estimate_reduction_potential(cat[0])
+                'category': emissions_by_category[category_id]['name'],
+                'emissions': emissions_by_category[category_id]['emissions'],
+                'percentage': emissions_by_category[category_id]['percentage'],
+                'reduction_potential': self._estimate_reduction_potential(category_id)
             }
-            for cat in sorted_categories[:5]
+            for category_id in top_categories
         ]
         
         # Scope 1,2,3 통합
@@ -227,45 +250,40 @@ class SupplyChainAnalyzer:
         
         # 공급업체 리스트가 없으면 시뮬레이션
         if not supplier_list:
-            supplier_list = self._simulate_suppliers(profile)
+            supplier_list = self._simulate_suppliers(profile, self._rng(company_data, SUPPLIER_STREAM))
         
-        # 공급업체별 리스크 평가
-        assessed_suppliers = []
-        high_risk_count = 0
-        medium_risk_count = 0
-        low_risk_count = 0
+        # 공급업체별 리스크 일괄 계산
+        risks = self._calculate_supplier_risks(supplier_list)
+        total_scores = risks['total_score']
         
-        for supplier in supplier_list:
-            risk_scores = self._calculate_supplier_risk(supplier)
-            
-            # 종합 리스크 레벨 결정
-            total_risk = risk_scores['total_score']
-            if total_risk < 40:
-                risk_level = "High"
-                high_risk_count += 1
-            elif total_risk < 70:
-                risk_level = "Medium"
-                medium_risk_count += 1
-            else:
-                risk_level = "Low"
-                low_risk_count += 1
+        # 종합 리스크 레벨 결정
+        risk_levels = np.select([total_scores < 40, total_scores < 70], ["High", "Medium"], default="Low")
+        high_risk_count = int(np.count_nonzero(risk_levels == "High"))
+        medium_risk_count = int(np.count_nonzero(risk_levels == "Medium"))
+        low_risk_count = int(np.count_nonzero(risk_levels == "Low"))
+        
+        risk_columns = {key: values.tolist() for key, values in risks.items()}
+        risk_levels = risk_levels.tolist()
+        
+        # 리스크별 정렬 (낮은 점수 = 고위험 우선)
+        assessed_suppliers = []
+        for idx in np.argsort(total_scores, kind='stable').tolist():
+            supplier = supplier_list[idx]
+            risk_scores = {key: values[idx] for key, values in risk_columns.items()}
             
             assessed_suppliers.append({
                 'supplier_name': supplier['name'],
                 'tier': supplier['tier'],
                 'location': supplier.get('location', 'Korea'),
                 'spend': supplier.get('spend', 100),  # 억원
-                'risk_level': risk_level,
+                'risk_level': risk_levels[idx],
                 'risk_scores': risk_scores,
                 'critical': supplier.get('critical', False),
                 'improvement_areas': self._identify_supplier_improvements(risk_scores)
             })
         
-        # 리스크별 정렬
-        assessed_suppliers.sort(key=lambda x: x['risk_scores']['total_score'])
-        
         # 공급망 전체 리스크 점수
-        avg_risk_score = np.mean([s['risk_scores']['total_score'] for s in assessed_suppliers])
+        avg_risk_score = float(total_scores.mean())
         
         # 집중도 리스크 분석
         concentration_risk = self._analyze_concentration_risk(assessed_suppliers)
@@ -290,7 +308,7 @@ class SupplyChainAnalyzer:
             'action_plan': self._create_action_plan(assessed_suppliers)
         }
     
-    def _simulate_supply_chain(self, industry: str, revenue: float) -> dict:
+    def _simulate_supply_chain(self, industry: str, revenue: float, rng: np.random.Generator) -> dict:
         """공급망 데이터 시뮬레이션"""
         supply_chain = {}
         
@@ -304,7 +322,7 @@ class SupplyChainAnalyzer:
                 weights = {"purchased_goods": 0.3, "business_travel": 0.2}
             
             weight = weights.get(category_id, 0.05)
-            amount = revenue * weight * np.random.uniform(0.8, 1.2)
+            amount = revenue * weight * rng.uniform(0.8, 1.2)
             
             supply_chain[category_id] = {
                 'amount': amount,
@@ -314,7 +332,7 @@ class SupplyChainAnalyzer:
         
         return supply_chain
     
-    def _simulate_suppliers(self, profile: dict) -> List[dict]:
+    def _simulate_suppliers(self, profile: dict, rng: np.random.Generator) -> List[dict]:
         """공급업체 리스트 시뮬레이션"""
         suppliers = []
         
@@ -323,13 +341,13 @@ class SupplyChainAnalyzer:
             suppliers.append({
                 'name': f"Supplier_T1_{i+1}",
                 'tier': 1,
-                'location': np.random.choice(['Korea', 'China', 'Japan', 'USA', 'EU']),
-                'spend': np.random.uniform(50, 500),
-                'critical': np.random.random() < 0.2,
+                'location': rng.choice(['Korea', 'China', 'Japan', 'USA', 'EU']),
+                'spend': rng.uniform(50, 500),
+                'critical': rng.random() < 0.2,
                 'esg_scores': {
-                    'E': np.random.uniform(40, 90),
-                    'S': np.random.uniform(40, 90),
-                    'G': np.random.uniform(40, 90)
+                    'E': rng.uniform(40, 90),
+                    'S': rng.uniform(40, 90),
+                    'G': rng.uniform(40, 90)
                 }
             })
         
@@ -338,54 +356,45 @@ class SupplyChainAnalyzer:
             suppliers.append({
                 'name': f"Supplier_T2_{i+1}",
                 'tier': 2,
-                'location': np.random.choice(['Korea', 'China', 'Vietnam', 'India']),
-                'spend': np.random.uniform(10, 100),
-                'critical': np.random.random() < 0.05,
+                'location': rng.choice(['Korea', 'China', 'Vietnam', 'India']),
+                'spend': rng.uniform(10, 100),
+                'critical': rng.random() < 0.05,
                 'esg_scores': {
-                    'E': np.random.uniform(30, 80),
-                    'S': np.random.uniform(30, 80),
-                    'G': np.random.uniform(30, 80)
+                    'E': rng.uniform(30, 80),
+                    'S': rng.uniform(30, 80),
+                    'G': rng.uniform(30, 80)
                 }
             })
         
         return suppliers
     
-    def _calculate_supplier_risk(self, supplier: dict) -> dict:
-        """개별 공급업체 리스크 계산"""
-        esg_scores = supplier.get('esg_scores', {})
-        
+    def _calculate_supplier_risks(self, suppliers: List[dict]) -> Dict[str, np.ndarray]:
+        """공급업체 리스크 일괄 계산 (공급업체 순서의 배열 반환)"""
         # ESG 각 영역별 리스크 (100 - 점수)
-        e_risk = 100 - esg_scores.get('E', 50)
-        s_risk = 100 - esg_scores.get('S', 50)
-        g_risk = 100 - esg_scores.get('G', 50)
+        esg_scores = np.array([
+            [supplier.get('esg_scores', {}).get(area, 50) for area in ('E', 'S', 'G')]
+            for supplier in suppliers
+        ], dtype=np.float64)
+        area_risks = 100 - esg_scores
         
         # Tier별 가중치
-        tier_weight = 1.0 if supplier['tier'] == 1 else 0.7
+        tier_weights = np.where(np.array([supplier['tier'] for supplier in suppliers]) == 1, 1.0, 0.7)
         
         # 지역별 리스크 조정
-        location_risk = {
-            'Korea': 1.0,
-            'Japan': 1.0,
-            'USA': 1.1,
-            'EU': 1.0,
-            'China': 1.3,
-            'Vietnam': 1.4,
-            'India': 1.5
-        }
-        location_factor = location_risk.get(supplier.get('location', 'Korea'), 1.2)
+        location_factors = np.array([
+            self.location_risk.get(supplier.get('location', 'Korea'), 1.2) for supplier in suppliers
+        ])
         
         # 종합 리스크 점수 (낮을수록 고위험)
-        total_score = ((100 - e_risk * 0.35) + 
-                      (100 - s_risk * 0.35) + 
-                      (100 - g_risk * 0.3)) * tier_weight / location_factor
+        total_scores = (300 - area_risks @ np.array([0.35, 0.35, 0.3])) * tier_weights / location_factors
         
         return {
-            'environmental_risk': round(e_risk, 1),
-            'social_risk': round(s_risk, 1),
-            'governance_risk': round(g_risk, 1),
-            'total_score': round(total_score, 1),
-            'tier_factor': tier_weight,
-            'location_factor': location_factor
+            'environmental_risk': np.round(area_risks[:, 0], 1),
+            'social_risk': np.round(area_risks[:, 1], 1),
+            'governance_risk': np.round(area_risks[:, 2], 1),
+            'total_score': np.round(total_scores, 1),
+            'tier_factor': tier_weights,
+            'location_factor': location_factors
         }
     
     def _identify_supplier_improvements(self, risk_scores: dict) -> List[str]:
@@ -403,12 +412,13 @@ class SupplyChainAnalyzer:
     
     def _analyze_concentration_risk(self, suppliers: List[dict]) -> dict:
         """공급망 집중도 리스크 분석"""
-        total_spend = sum(s['spend'] for s in suppliers)
+        # 지출액 내림차순 배열 (공급업체 dict 정렬 대신 수치 배열만 정렬)
+        spends = np.sort(np.fromiter((s['spend'] for s in suppliers), dtype=np.float64))[::-1]
+        total_spend = float(spends.sum())
         
         # 상위 공급업체 집중도
-        sorted_suppliers = sorted(suppliers, key=lambda x: x['spend'], reverse=True)
-        top5_spend = sum(s['spend'] for s in sorted_suppliers[:5])
-        top10_spend = sum(s['spend'] for s in sorted_suppliers[:10])
+        top5_spend = float(spends[:5].sum())
+        top10_spend = float(spends[:10].sum())
         
         concentration_score = 100
         if top5_spend / total_spend > 0.5:
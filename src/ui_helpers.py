@@ -0,0 +1,16 @@
+"""
+Streamlit 화면 공통 헬퍼
+마크다운/HTML 조각 생성
+"""
+
+# 규제 준수 카드
+COMPLIANCE_CARD_TEMPLATE = (
+    '<div style="text-align: center; padding: 1rem; border: 2px solid {color}; border-radius: 8px;">'
+    '<div style="font-weight: 600;">{name}</div>'
+    '<div style="color: {color}; font-size: 1.2rem; margin-top: .5rem;">{status}</div>'
+    '</div>'
+)
+
+def bullet_markdown(items, mark: str = "•") -> str:
+    """항목 목록을 단일 마크다운 문자열로 결합 (줄바꿈 유지)"""
+    return "  \n".join(f"{mark} {item}" for item in items)
@@ -0,0 +1,8 @@
+"""
+테스트 공통 설정
+"""
+import os
+import sys
+
+# 프로젝트 루트를 import 경로에 추가 (app_v4.py와 동일한 방식)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
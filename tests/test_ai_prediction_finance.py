@@ -0,0 +1,20 @@
+"""
+AI 예측 모듈 테스트
+"""
+import numpy as np
+
+from src.ai_prediction_finance import AIPredictor, HISTORY_STREAM, FORECAST_STREAM
+
+
+def test_history_and_forecast_streams_differ():
+    """과거 생성과 미래 예측 난수 스트림은 서로 독립"""
+    history = AIPredictor._rng("삼성전자", HISTORY_STREAM).normal(size=16)
+    forecast = AIPredictor._rng("삼성전자", FORECAST_STREAM).normal(size=16)
+    assert not np.allclose(history, forecast)
+
+
+def test_stream_is_reproducible_per_company():
+    """같은 기업·스트림은 항상 같은 난수열"""
+    first = AIPredictor._rng("삼성전자", FORECAST_STREAM).normal(size=16)
+    second = AIPredictor._rng("삼성전자", FORECAST_STREAM).normal(size=16)
+    np.testing.assert_array_equal(first, second)
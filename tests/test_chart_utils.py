@@ -0,0 +1,30 @@
+"""
+차트 데이터 유틸리티 테스트
+"""
+import numpy as np
+
+from src.chart_utils import MAX_TRACE_POINTS, lttb_indices
+
+
+def test_lttb_keeps_short_series():
+    """최대 포인트 이하 시리즈는 그대로 유지"""
+    values = np.linspace(0, 1, 60)
+    np.testing.assert_array_equal(lttb_indices(values), np.arange(60))
+
+
+def test_lttb_downsamples_long_series():
+    """최대 포인트 초과 시 양 끝점 유지, 정렬된 고유 인덱스 반환"""
+    values = np.random.default_rng(0).normal(size=5000).cumsum()
+    idx = lttb_indices(values)
+    
+    assert len(idx) == MAX_TRACE_POINTS
+    assert idx[0] == 0
+    assert idx[-1] == len(values) - 1
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_lttb_keeps_extreme_spike():
+    """고립된 극값은 다운샘플링 후에도 남음"""
+    values = np.zeros(2000)
+    values[1234] = 100.0
+    assert 1234 in lttb_indices(values, max_points=100)